@@ -0,0 +1,774 @@
+from collections import Counter
+
+from utils.constants import Constants
+from utils.figure_manager import FigureManager
+
+
+class Board:
+    TASKS = ["1a", "1b", "1c", "2a", "3a", "3b", "4.1a", "4.1b", "4.1c", "4.2a", "4.3a", "4.3b"]
+    CELL_TASKS = ["1c", "4.1c", "2a", "4.2a", "3b", "4.3b"]
+    FORBIDDEN_BITS = {0: 1, 5: 2, 6: 4, 7: 8, 8: 16}
+    ALLOWED_FORBIDDEN_BITS = {0: 0, 1: 4 | 8, 2: 8 | 16, 3: 2 | 4, 4: 2 | 16}
+    BOUNDARY_POINTS = {
+        0: [(0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (2, 1), (1, 0), (1, 2)],
+        1: [(0, 0), (0, 2), (2, 0), (0, 1), (1, 0), (1, 1)],
+        2: [(0, 0), (0, 2), (2, 2), (0, 1), (1, 2), (1, 1)],
+        3: [(0, 0), (2, 0), (2, 2), (1, 0), (2, 1), (1, 1)],
+        4: [(0, 2), (2, 0), (2, 2), (1, 2), (2, 1), (1, 1)]
+    }
+    FORBIDDEN_STATES = bytes([0] + [1] * 255)
+    OCCUPIED_STATES = bytes([0] + [2] * 255)
+    LOOSE_CELL_STATE = 4
+    VIOLATING_STATE = 5
+
+    def __init__(self, grid_size=Constants.DEFAULT_GRID_SIZE, task="1a", variables=None):
+        self.grid_size = grid_size
+        self.current_task = task
+        self.variables = variables if variables is not None else {"s": 1, "t": 1}
+        self.figure_cache = {}
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        self.figures = {}
+        self.figure_zones = {}
+        self.cell_figures = {}
+        self.next_figure_id = 0
+        self.forbidden_counts = {}
+        self.cells = {}
+        self.parent = {}
+        self.members = {}
+        self.weights = {}
+        self.figure_points = {}
+        self.point_figures = {}
+        self.touching = {}
+        self.build_boundary_offsets()
+        self.occupancy = bytearray(self.grid_size * self.grid_size)
+        self.forbidden_mask = bytearray(self.grid_size * self.grid_size)
+        self.changed_bounds = self.get_full_bounds()
+        self.version += 1
+
+    def set_grid_size(self, size):
+        self.grid_size = size
+        self.clear()
+
+    def set_task(self, task):
+        self.current_task = task
+        self.figure_cache = {}
+        self.clear()
+
+    def set_variables(self, variables):
+        self.variables = variables
+        self.figure_cache = {}
+
+    @property
+    def placed_figures(self):
+        return list(self.figures.values())
+
+    @property
+    def placed_cells(self):
+        return self.cells.items()
+
+    @property
+    def forbidden_zones(self):
+        return self.forbidden_counts.keys()
+
+    def load_state(self, placed_figures, placed_cells):
+        self.clear()
+
+        for figure in placed_figures:
+            self.load_figure(figure)
+        for coord, cell_type in placed_cells:
+            self.load_cell(coord, cell_type)
+
+        self.finish_load()
+
+    def load_solution(self, figures):
+        if self.is_cell_task():
+            self.load_state([], [cell for figure in figures for cell in figure])
+        else:
+            self.load_state(figures, [])
+
+    def load_figure(self, figure):
+        if self.is_cell_task():
+            return
+
+        cells = [((coord[0], coord[1]), cell_type) for coord, cell_type in figure]
+        for (row, col), cell_type in cells:
+            self.check_bounds((row, col))
+            self.occupancy[self.cell_index(row, col)] = cell_type + 1
+        self.figures[self.next_figure_id] = cells
+        self.next_figure_id += 1
+
+    def load_cell(self, coord, cell_type):
+        if not self.is_cell_task():
+            return
+
+        self.check_bounds(coord)
+        self.cells[(coord[0], coord[1])] = cell_type
+        self.occupancy[self.cell_index(coord[0], coord[1])] = cell_type + 1
+
+    def finish_load(self):
+        if self.is_cell_task():
+            self.update_figures_from_components()
+        else:
+            self.rebuild_figures()
+
+    def rebuild_figures(self):
+        self.figure_zones = {}
+        self.cell_figures = {}
+        self.forbidden_mask = bytearray(self.grid_size * self.grid_size)
+        self.figure_points = {}
+        self.point_figures = {}
+        self.touching = {}
+
+        forbidden_counts = Counter()
+        for figure_id, cells in self.figures.items():
+            forbidden_cells = self.get_forbidden_zone_cells(cells)
+            self.figure_zones[figure_id] = forbidden_cells
+            forbidden_counts.update(forbidden_cells)
+            for coord, cell_type in cells:
+                self.cell_figures[coord] = figure_id
+            self.add_touching(figure_id, cells)
+
+        self.forbidden_counts = dict(forbidden_counts)
+        for (row, col), forbidden_type in self.forbidden_counts:
+            self.forbidden_mask[self.cell_index(row, col)] |= self.FORBIDDEN_BITS[forbidden_type]
+
+        self.changed_bounds = self.get_full_bounds()
+        self.version += 1
+
+    def is_cell_task(self):
+        return self.current_task in self.CELL_TASKS
+
+    def is_triangle_task(self):
+        return self.current_task in ["2a", "4.2a"]
+
+    def is_lattice_task(self):
+        return False
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.grid_size and 0 <= col < self.grid_size
+
+    def cell_index(self, row, col):
+        return row * self.grid_size + col
+
+    def cell_coord(self, index):
+        return divmod(index, self.grid_size)
+
+    def get_full_bounds(self):
+        return (0, 0, self.grid_size - 1, self.grid_size - 1)
+
+    def check_bounds(self, coord):
+        if not self.in_bounds(coord[0], coord[1]):
+            raise ValueError(f'Клетка ({coord[0]}, {coord[1]}) вне поля {self.grid_size}x{self.grid_size}')
+
+    def mark_occupied(self, cells):
+        for (row, col), cell_type in cells:
+            self.occupancy[self.cell_index(row, col)] = cell_type + 1
+        self.extend_changed_bounds(cells)
+
+    def mark_free(self, cells):
+        for (row, col), cell_type in cells:
+            self.occupancy[self.cell_index(row, col)] = 0
+        self.extend_changed_bounds(cells)
+
+    def extend_changed_bounds(self, cells):
+        if not cells:
+            return
+
+        rows = [row for (row, col), cell_type in cells]
+        cols = [col for (row, col), cell_type in cells]
+        bounds = (min(rows), min(cols), max(rows), max(cols))
+
+        if self.changed_bounds is not None:
+            bounds = (
+                min(bounds[0], self.changed_bounds[0]),
+                min(bounds[1], self.changed_bounds[1]),
+                max(bounds[2], self.changed_bounds[2]),
+                max(bounds[3], self.changed_bounds[3])
+            )
+
+        self.changed_bounds = bounds
+        self.version += 1
+
+    def get_cell_states(self, violating_figures=()):
+        size = len(self.occupancy)
+        occupied = int.from_bytes(self.occupancy.translate(self.OCCUPIED_STATES), 'big')
+        forbidden = int.from_bytes(self.forbidden_mask.translate(self.FORBIDDEN_STATES), 'big')
+        states = bytearray((occupied | forbidden).to_bytes(size, 'big'))
+
+        for root, component in self.members.items():
+            if root not in self.figures:
+                for row, col in component:
+                    states[self.cell_index(row, col)] = self.LOOSE_CELL_STATE
+
+        for figure_id in violating_figures:
+            for (row, col), cell_type in self.figures[figure_id]:
+                states[self.cell_index(row, col)] = self.VIOLATING_STATE
+
+        return states
+
+    def take_changed_bounds(self):
+        bounds = self.changed_bounds
+        self.changed_bounds = None
+        return bounds
+
+    def add_forbidden_zone(self, forbidden_cells):
+        counts = self.forbidden_counts
+        for cell in forbidden_cells:
+            count = counts.get(cell, 0)
+            counts[cell] = count + 1
+            if count == 0:
+                (row, col), forbidden_type = cell
+                self.forbidden_mask[self.cell_index(row, col)] |= self.FORBIDDEN_BITS[forbidden_type]
+
+    def remove_forbidden_zone(self, forbidden_cells):
+        counts = self.forbidden_counts
+        for cell in forbidden_cells:
+            count = counts[cell] - 1
+            if count:
+                counts[cell] = count
+            else:
+                del counts[cell]
+                (row, col), forbidden_type = cell
+                self.forbidden_mask[self.cell_index(row, col)] &= ~self.FORBIDDEN_BITS[forbidden_type]
+
+    def add_figure(self, figure_id, cells):
+        forbidden_cells = self.get_forbidden_zone_cells(cells)
+        self.figures[figure_id] = cells
+        self.figure_zones[figure_id] = forbidden_cells
+        for coord, cell_type in cells:
+            self.cell_figures[coord] = figure_id
+        self.add_forbidden_zone(forbidden_cells)
+        self.add_touching(figure_id, cells)
+        self.extend_changed_bounds(cells)
+        self.extend_changed_bounds(forbidden_cells)
+
+    def drop_figure(self, figure_id):
+        if figure_id in self.figures:
+            forbidden_cells = self.figure_zones.pop(figure_id)
+            self.remove_forbidden_zone(forbidden_cells)
+            cells = self.figures.pop(figure_id)
+            for coord, cell_type in cells:
+                if self.cell_figures.get(coord) == figure_id:
+                    del self.cell_figures[coord]
+            self.extend_changed_bounds(cells)
+            self.extend_changed_bounds(forbidden_cells)
+            self.remove_touching(figure_id)
+
+    def get_max_common_points(self):
+        if self.current_task == "2a":
+            return 0
+        elif self.current_task == "4.2a":
+            return 1
+        return None
+
+    def add_touching(self, figure_id, cells):
+        max_common_points = self.get_max_common_points()
+        if max_common_points is None:
+            return
+
+        points = self.get_figure_boundary_points(cells)
+        self.figure_points[figure_id] = points
+
+        common_points = {}
+        for point in points:
+            owners = self.point_figures.setdefault(point, set())
+            for other_id in owners:
+                common_points[other_id] = common_points.get(other_id, 0) + 1
+            owners.add(figure_id)
+
+        for other_id, count in common_points.items():
+            if count > max_common_points:
+                if other_id not in self.touching:
+                    self.extend_changed_bounds(self.figures[other_id])
+                self.touching.setdefault(other_id, set()).add(figure_id)
+                self.touching.setdefault(figure_id, set()).add(other_id)
+
+    def remove_touching(self, figure_id):
+        points = self.figure_points.pop(figure_id, None)
+        if points is None:
+            return
+
+        for point in points:
+            owners = self.point_figures[point]
+            owners.discard(figure_id)
+            if not owners:
+                del self.point_figures[point]
+
+        for other_id in self.touching.pop(figure_id, ()):
+            partners = self.touching[other_id]
+            partners.discard(figure_id)
+            if not partners:
+                del self.touching[other_id]
+                self.extend_changed_bounds(self.figures.get(other_id, []))
+
+    def get_figure_shape(self, figure_type=0):
+        if self.current_task in ["1a", "4.1a"]:
+            return FigureManager.get_figure_shapes()["corner"]
+        elif self.current_task in ["1b", "4.1b"]:
+            s, t = self.variables["s"], self.variables["t"]
+            rectangle = []
+            for i in range(s):
+                for j in range(t):
+                    rectangle.append((i, j))
+            return rectangle
+        elif self.current_task in ["2a", "4.2a"]:
+            return FigureManager.get_triangle_shape_by_type(figure_type)
+        return FigureManager.get_figure_shapes()["corner"]
+
+    def get_rotated_figure(self, rotation=0, figure_type=0):
+        key = (rotation % 4, figure_type)
+        figure = self.figure_cache.get(key)
+        if figure is None:
+            figure = FigureManager.rotate_figure(self.get_figure_shape(figure_type), rotation)
+            self.figure_cache[key] = figure
+        return figure
+
+    def get_figure_cells(self, base_row, base_col, rotation=0, figure_type=0):
+        cells = []
+
+        if self.current_task in ["2a", "4.2a"]:
+            if self.in_bounds(base_row, base_col):
+                cells.append(((base_row, base_col), figure_type))
+        else:
+            for dr, dc in self.get_rotated_figure(rotation, figure_type):
+                new_row = base_row + dr
+                new_col = base_col + dc
+                if self.in_bounds(new_row, new_col):
+                    cells.append(((new_row, new_col), 0))
+
+        return cells
+
+    def get_cell_weight(self, cell_type):
+        if cell_type == 0:
+            return 1
+        else:
+            return 0.5
+
+    def are_cells_connected(self, cell1, cell2):
+        (row1, col1), type1 = cell1
+        (row2, col2), type2 = cell2
+
+        if abs(row1 - row2) + abs(col1 - col2) != 1:
+            return False
+
+        if self.current_task in ["2a", "4.2a"]:
+            return self.are_cells_connected_2a(cell1, cell2)
+
+        return True
+
+    def are_cells_connected_2a(self, cell1, cell2):
+        (row1, col1), type1 = cell1
+        (row2, col2), type2 = cell2
+        if type1 != 0 and type2 == 0:
+            (row1, col1), type1 = cell2
+            (row2, col2), type2 = cell1
+
+        if type1 == 0 and type2 == 0:
+            return True
+
+        if type1 > 0 and type2 > 0 and type1 == type2:
+            return False
+
+        if type1 == 0:
+            if row1 - row2 == 1:
+                return type2 in [3, 4]
+            if row1 - row2 == -1:
+                return type2 in [1, 2]
+            if col1 - col2 == 1:
+                return type2 in [2, 4]
+            if col1 - col2 == -1:
+                return type2 in [1, 3]
+
+        if type1 == 1:
+            if type2 == 2:
+                return col1 - col2 == 1
+            elif type2 == 3:
+                return row1 - row2 == 1
+            elif type2 == 4:
+                return col1 - col2 == 1 or row1 - row2 == 1
+        elif type1 == 2:
+            if type2 == 1:
+                return col1 - col2 == -1
+            elif type2 == 4:
+                return row1 - row2 == 1
+            elif type2 == 3:
+                return col1 - col2 == -1 or row1 - row2 == 1
+        elif type1 == 3:
+            if type2 == 4:
+                return col1 - col2 == 1
+            elif type2 == 1:
+                return row1 - row2 == -1
+            elif type2 == 2:
+                return col1 - col2 == 1 or row1 - row2 == -1
+        elif type1 == 4:
+            if type2 == 3:
+                return col1 - col2 == -1
+            elif type2 == 2:
+                return row1 - row2 == -1
+            elif type2 == 1:
+                return col1 - col2 == -1 or row1 - row2 == -1
+
+        return False
+
+    def count_common_points(self, figure1, figure2):
+        figure1_points = self.get_figure_boundary_points(figure1)
+        figure2_points = self.get_figure_boundary_points(figure2)
+        return len(figure1_points.intersection(figure2_points))
+
+    def get_figure_boundary_points(self, figure):
+        boundary_points = set()
+        is_triangle_task = self.is_triangle_task()
+
+        for (row, col), cell_type in figure:
+            base = 2 * row * self.point_stride + 2 * col
+            offsets = self.boundary_offsets.get(cell_type if is_triangle_task else 0, ())
+            boundary_points.update(base + offset for offset in offsets)
+
+        return boundary_points
+
+    def build_boundary_offsets(self):
+        self.point_stride = 2 * self.grid_size + 1
+        self.boundary_offsets = {
+            cell_type: [drow * self.point_stride + dcol for drow, dcol in points]
+            for cell_type, points in self.BOUNDARY_POINTS.items()
+        }
+
+    def check_figures_touching(self):
+        return list(self.touching)
+
+    def find_conflicts(self):
+        conflicts = set()
+
+        owners = {}
+        for figure_id, figure in self.figures.items():
+            for coord, cell_type in figure:
+                if coord in owners:
+                    conflicts.update((figure_id, owners[coord]))
+                owners[coord] = figure_id
+
+        for figure_id, zone in self.figure_zones.items():
+            figure_coords = set(coord for coord, cell_type in self.figures[figure_id])
+            for (row, col), forbidden_type in zone:
+                if (row, col) in figure_coords:
+                    continue
+                value = self.occupancy[self.cell_index(row, col)]
+                if not value:
+                    continue
+                if self.is_triangle_task() and self.can_place_in_forbidden_zone(value - 1, forbidden_type):
+                    continue
+                conflicts.add(figure_id)
+
+        return conflicts
+
+    def get_connected_neighbours(self, coord, cell_type):
+        row, col = coord
+
+        for neighbour in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            neighbour_type = self.cells.get(neighbour)
+            if neighbour_type is not None and self.are_cells_connected((coord, cell_type), (neighbour, neighbour_type)):
+                yield neighbour
+
+    def find_root(self, coord):
+        parent = self.parent
+        root = coord
+        while parent[root] != root:
+            root = parent[root]
+        while parent[coord] != root:
+            parent[coord], coord = root, parent[coord]
+        return root
+
+    def union(self, root1, root2):
+        if len(self.members[root1]) < len(self.members[root2]):
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.members[root1].extend(self.members.pop(root2))
+        self.weights[root1] += self.weights.pop(root2)
+        return root1
+
+    def find_connected_components(self):
+        return [
+            [(coord, self.cells[coord]) for coord in component]
+            for component in self.members.values()
+        ]
+
+    def is_valid_component(self, root):
+        if self.is_triangle_task():
+            return self.weights[root] == self.variables["s"]
+        else:
+            return len(self.members[root]) == self.variables["s"]
+
+    def refresh_component(self, root):
+        if self.is_valid_component(root):
+            self.add_figure(root, [(coord, self.cells[coord]) for coord in self.members[root]])
+
+    def build_component(self, start, remaining):
+        self.parent[start] = start
+        component = [start]
+        weight = self.get_cell_weight(self.cells[start])
+        stack = [start]
+
+        while stack:
+            current = stack.pop()
+            for neighbour in self.get_connected_neighbours(current, self.cells[current]):
+                if neighbour in remaining:
+                    remaining.remove(neighbour)
+                    self.parent[neighbour] = start
+                    component.append(neighbour)
+                    weight += self.get_cell_weight(self.cells[neighbour])
+                    stack.append(neighbour)
+
+        self.members[start] = component
+        self.weights[start] = weight
+        return start
+
+    def add_cell(self, coord, cell_type):
+        self.cells[coord] = cell_type
+        self.parent[coord] = coord
+        self.members[coord] = [coord]
+        self.weights[coord] = self.get_cell_weight(cell_type)
+
+        root = coord
+        for neighbour in self.get_connected_neighbours(coord, cell_type):
+            neighbour_root = self.find_root(neighbour)
+            if neighbour_root != root:
+                self.drop_figure(neighbour_root)
+                root = self.union(root, neighbour_root)
+
+        self.refresh_component(root)
+
+    def remove_cell(self, coord):
+        root = self.find_root(coord)
+        self.drop_figure(root)
+
+        component = self.members.pop(root)
+        del self.weights[root]
+        for member in component:
+            del self.parent[member]
+        del self.cells[coord]
+
+        remaining = set(component)
+        remaining.discard(coord)
+        while remaining:
+            self.refresh_component(self.build_component(remaining.pop(), remaining))
+
+    def update_figures_from_components(self):
+        self.figures = {}
+        self.parent = {}
+        self.members = {}
+        self.weights = {}
+
+        remaining = set(self.cells)
+        while remaining:
+            root = self.build_component(remaining.pop(), remaining)
+            if self.is_valid_component(root):
+                self.figures[root] = [(coord, self.cells[coord]) for coord in self.members[root]]
+
+        self.rebuild_figures()
+
+    def get_forbidden_zone_cells(self, figure_cells):
+        if self.current_task == "2a":
+            return self.get_forbidden_zone_2a(figure_cells)
+        elif self.current_task == "4.2a":
+            return self.get_forbidden_zone_4_2a(figure_cells)
+        elif self.current_task in ["1a", "1b", "1c"]:
+            return self.get_forbidden_zone_1abc(figure_cells)
+        elif self.current_task in ["4.1a", "4.1b", "4.1c"]:
+            return self.get_forbidden_zone_4_1abc(figure_cells)
+        return []
+
+    def add_forbidden(self, forbidden_cells, row, col, *forbidden_types):
+        if self.in_bounds(row, col):
+            for forbidden_type in forbidden_types:
+                forbidden_cells.append(((row, col), forbidden_type))
+
+    def get_forbidden_zone_2a(self, figure_cells):
+        forbidden_cells = []
+
+        for (row, col), cell_type in figure_cells:
+            self.add_forbidden(forbidden_cells, row, col, 5, 6, 7, 8)
+
+            if cell_type == 0:
+                for drow, dcol in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                    self.add_forbidden(forbidden_cells, row + drow, col + dcol, 5, 6, 7, 8)
+                self.add_forbidden(forbidden_cells, row - 1, col - 1, 6, 7)
+                self.add_forbidden(forbidden_cells, row - 1, col + 1, 7, 8)
+                self.add_forbidden(forbidden_cells, row + 1, col - 1, 5, 6)
+                self.add_forbidden(forbidden_cells, row + 1, col + 1, 5, 8)
+
+            elif cell_type == 1:
+                for drow, dcol in [(-1, 0), (0, -1)]:
+                    self.add_forbidden(forbidden_cells, row + drow, col + dcol, 5, 6, 7, 8)
+                self.add_forbidden(forbidden_cells, row, col + 1, 5, 8)
+                self.add_forbidden(forbidden_cells, row + 1, col, 5, 8)
+                self.add_forbidden(forbidden_cells, row - 1, col - 1, 6, 7)
+                self.add_forbidden(forbidden_cells, row - 1, col + 1, 7, 8)
+                self.add_forbidden(forbidden_cells, row + 1, col - 1, 5, 6)
+
+            elif cell_type == 2:
+                for drow, dcol in [(-1, 0), (0, 1)]:
+                    self.add_forbidden(forbidden_cells, row + drow, col + dcol, 5, 6, 7, 8)
+                self.add_forbidden(forbidden_cells, row, col - 1, 5, 6)
+                self.add_forbidden(forbidden_cells, row + 1, col, 5, 6)
+                self.add_forbidden(forbidden_cells, row - 1, col - 1, 6, 7)
+                self.add_forbidden(forbidden_cells, row - 1, col + 1, 7, 8)
+                self.add_forbidden(forbidden_cells, row + 1, col + 1, 5, 8)
+
+            elif cell_type == 3:
+                for drow, dcol in [(1, 0), (0, -1)]:
+                    self.add_forbidden(forbidden_cells, row + drow, col + dcol, 5, 6, 7, 8)
+                self.add_forbidden(forbidden_cells, row, col + 1, 7, 8)
+                self.add_forbidden(forbidden_cells, row - 1, col, 7, 8)
+                self.add_forbidden(forbidden_cells, row - 1, col - 1, 6, 7)
+                self.add_forbidden(forbidden_cells, row + 1, col - 1, 5, 6)
+                self.add_forbidden(forbidden_cells, row + 1, col + 1, 5, 8)
+
+            elif cell_type == 4:
+                for drow, dcol in [(1, 0), (0, 1)]:
+                    self.add_forbidden(forbidden_cells, row + drow, col + dcol, 5, 6, 7, 8)
+                self.add_forbidden(forbidden_cells, row, col - 1, 6, 7)
+                self.add_forbidden(forbidden_cells, row - 1, col, 6, 7)
+                self.add_forbidden(forbidden_cells, row - 1, col + 1, 7, 8)
+                self.add_forbidden(forbidden_cells, row + 1, col - 1, 5, 6)
+                self.add_forbidden(forbidden_cells, row + 1, col + 1, 5, 8)
+
+        return list(set(forbidden_cells))
+
+    def get_forbidden_zone_4_2a(self, figure_cells):
+        forbidden_cells = []
+
+        for (row, col), cell_type in figure_cells:
+            self.add_forbidden(forbidden_cells, row, col, 5, 6, 7, 8)
+
+            if cell_type == 0:
+                self.add_forbidden(forbidden_cells, row, col - 1, 6)
+                self.add_forbidden(forbidden_cells, row, col + 1, 8)
+                self.add_forbidden(forbidden_cells, row - 1, col, 7)
+                self.add_forbidden(forbidden_cells, row + 1, col, 5)
+            elif cell_type == 1:
+                self.add_forbidden(forbidden_cells, row, col - 1, 6)
+                self.add_forbidden(forbidden_cells, row - 1, col, 7)
+            elif cell_type == 2:
+                self.add_forbidden(forbidden_cells, row, col + 1, 8)
+                self.add_forbidden(forbidden_cells, row - 1, col, 7)
+            elif cell_type == 3:
+                self.add_forbidden(forbidden_cells, row, col - 1, 6)
+                self.add_forbidden(forbidden_cells, row + 1, col, 5)
+            elif cell_type == 4:
+                self.add_forbidden(forbidden_cells, row, col + 1, 8)
+                self.add_forbidden(forbidden_cells, row + 1, col, 5)
+
+        return list(set(forbidden_cells))
+
+    def can_place_in_forbidden_zone(self, cell_type, forbidden_type):
+        if forbidden_type == 5:
+            return cell_type in [3, 4]
+        elif forbidden_type == 6:
+            return cell_type in [1, 3]
+        elif forbidden_type == 7:
+            return cell_type in [1, 2]
+        elif forbidden_type == 8:
+            return cell_type in [2, 4]
+        return False
+
+    def get_forbidden_zone_1abc(self, figure_cells):
+        return self.get_neighbour_zone(figure_cells, [
+            (-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)
+        ])
+
+    def get_forbidden_zone_4_1abc(self, figure_cells):
+        return self.get_neighbour_zone(figure_cells, [(-1, 0), (1, 0), (0, -1), (0, 1)])
+
+    def get_neighbour_zone(self, figure_cells, directions):
+        figure_coords = set(coord for coord, cell_type in figure_cells)
+        forbidden_cells = set()
+
+        for row, col in figure_coords:
+            for dr, dc in directions:
+                new_row, new_col = row + dr, col + dc
+                if self.in_bounds(new_row, new_col) and (new_row, new_col) not in figure_coords:
+                    forbidden_cells.add(((new_row, new_col), 0))
+
+        return list(forbidden_cells)
+
+    def can_place_figure(self, row, col, rotation=0, figure_type=0):
+        grid_size = self.grid_size
+        occupancy = self.occupancy
+        forbidden_mask = self.forbidden_mask
+
+        if self.is_cell_task():
+            if not (0 <= row < grid_size and 0 <= col < grid_size):
+                return False
+
+            index = row * grid_size + col
+            if occupancy[index]:
+                return False
+
+            mask = forbidden_mask[index]
+            if mask:
+                if not self.is_triangle_task():
+                    return False
+                if mask & ~self.ALLOWED_FORBIDDEN_BITS[figure_type]:
+                    return False
+
+            return True
+
+        for dr, dc in self.get_rotated_figure(rotation, figure_type):
+            new_row = row + dr
+            new_col = col + dc
+            if not (0 <= new_row < grid_size and 0 <= new_col < grid_size):
+                return False
+
+            index = new_row * grid_size + new_col
+            if occupancy[index] or forbidden_mask[index]:
+                return False
+
+        return True
+
+    def place_figure(self, row, col, rotation=0, figure_type=0):
+        if not self.can_place_figure(row, col, rotation, figure_type):
+            return False
+
+        if self.is_cell_task():
+            cell_type = figure_type if self.is_triangle_task() else 0
+            self.mark_occupied([((row, col), cell_type)])
+            self.add_cell((row, col), cell_type)
+            return True
+
+        cells = self.get_figure_cells(row, col, rotation, figure_type)
+        figure_id = self.next_figure_id
+        self.next_figure_id += 1
+        self.add_figure(figure_id, cells)
+        self.mark_occupied(cells)
+        return True
+
+    def has_cell_at(self, row, col):
+        return self.in_bounds(row, col) and self.occupancy[self.cell_index(row, col)] != 0
+
+    def find_figure_at(self, row, col):
+        return self.cell_figures.get((row, col))
+
+    def is_occupied(self, row, col):
+        return self.has_cell_at(row, col)
+
+    def remove_figure_at(self, row, col):
+        if not self.has_cell_at(row, col):
+            return False
+
+        if self.is_cell_task():
+            self.mark_free([((row, col), self.cells[(row, col)])])
+            self.remove_cell((row, col))
+            return True
+
+        figure_id = self.find_figure_at(row, col)
+        if figure_id is None:
+            return False
+
+        self.mark_free(self.figures[figure_id])
+        self.drop_figure(figure_id)
+        return True
+
+    def get_figures_count(self):
+        return len(self.figures)
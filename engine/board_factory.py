@@ -0,0 +1,14 @@
+from engine.board import Board
+from engine.triangle_board import TriangleBoard
+
+
+class BoardFactory:
+    @staticmethod
+    def is_lattice_task(task):
+        return task in TriangleBoard.LATTICE_TASKS
+
+    @staticmethod
+    def create_board(grid_size, task, variables=None):
+        if BoardFactory.is_lattice_task(task):
+            return TriangleBoard(grid_size, task, variables)
+        return Board(grid_size, task, variables)
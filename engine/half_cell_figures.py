@@ -0,0 +1,101 @@
+import json
+import os
+
+from engine.board import Board
+from utils.constants import Constants
+
+
+class HalfCellFigures:
+    fixed_cache = {}
+    neighbours = None
+
+    @staticmethod
+    def get_neighbours():
+        if HalfCellFigures.neighbours is None:
+            board = Board(1, "2a")
+            HalfCellFigures.neighbours = {
+                cell_type: [
+                    (dr, dc, other_type)
+                    for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+                    for other_type in range(5)
+                    if board.are_cells_connected(((0, 0), cell_type), ((dr, dc), other_type))
+                ]
+                for cell_type in range(5)
+            }
+        return HalfCellFigures.neighbours
+
+    @staticmethod
+    def get_weight(cell_type):
+        return 2 if cell_type == 0 else 1
+
+    @staticmethod
+    def enumerate_fixed(s):
+        halves = 2 * s
+        if halves < 1:
+            return
+
+        neighbours = HalfCellFigures.get_neighbours()
+        figure = []
+        used = set()
+
+        def allowed(row, col):
+            return row > 0 or (row == 0 and col > 0)
+
+        def extend(untried, seen, weight):
+            while untried:
+                piece = untried.pop()
+                row, col, cell_type = piece
+                new_weight = weight + HalfCellFigures.get_weight(cell_type)
+                if (row, col) in used or new_weight > halves:
+                    continue
+
+                figure.append(piece)
+                used.add((row, col))
+
+                if new_weight == halves:
+                    yield tuple(sorted(figure))
+                else:
+                    new_pieces = [
+                        (row + dr, col + dc, other_type) for dr, dc, other_type in neighbours[cell_type]
+                        if allowed(row + dr, col + dc) and (row + dr, col + dc, other_type) not in seen
+                    ]
+                    yield from extend(untried + new_pieces, seen.union(new_pieces), new_weight)
+
+                used.discard((row, col))
+                figure.pop()
+
+        for cell_type in range(5):
+            start = (0, 0, cell_type)
+            yield from extend([start], {start}, 0)
+
+    @staticmethod
+    def get_cache_path(s):
+        return os.path.join(Constants.CACHE_DIR, "half_cells", f"{s}.json")
+
+    @staticmethod
+    def get_fixed(s):
+        shapes = HalfCellFigures.fixed_cache.get(s)
+        if shapes is not None:
+            return shapes
+
+        path = HalfCellFigures.get_cache_path(s)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                shapes = [tuple((row, col, cell_type) for row, col, cell_type in shape) for shape in json.load(f)]
+        except (OSError, ValueError):
+            shapes = sorted(HalfCellFigures.enumerate_fixed(s))
+            HalfCellFigures.save_cache(path, shapes)
+
+        HalfCellFigures.fixed_cache[s] = shapes
+        return shapes
+
+    @staticmethod
+    def save_cache(path, shapes):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump([[list(piece) for piece in shape] for shape in shapes], f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
@@ -0,0 +1,49 @@
+from engine.half_cell_figures import HalfCellFigures
+from engine.packing_solver import PackingSolver
+
+
+class HalfCellSolver(PackingSolver):
+    SUPPORTED_TASKS = ["2a"]
+    SLOTS = 5
+    QUARTERS = {0: [1, 2, 3, 4], 1: [1, 4], 2: [1, 2], 3: [3, 4], 4: [2, 3]}
+    FORBIDDEN_QUARTERS = {5: 1, 6: 2, 7: 3, 8: 4}
+
+    def get_cell_count(self):
+        return (2 * self.grid_size + 1) ** 2 * self.SLOTS
+
+    def slot_index(self, y, x, slot=0):
+        return (y * (2 * self.grid_size + 1) + x) * self.SLOTS + slot
+
+    def quarter_index(self, row, col, quarter):
+        return self.slot_index(2 * row + 1, 2 * col + 1, quarter)
+
+    def get_cell_indices(self, cells):
+        indices = [
+            self.quarter_index(row, col, quarter)
+            for (row, col), cell_type in cells
+            for quarter in self.QUARTERS[cell_type]
+        ]
+        for point in self.board.get_figure_boundary_points(cells):
+            y, x = divmod(point, self.board.point_stride)
+            indices.append(self.slot_index(y, x))
+        return indices
+
+    def get_zone_indices(self, cells):
+        return [
+            self.quarter_index(r, c, self.FORBIDDEN_QUARTERS[forbidden_type])
+            for (r, c), forbidden_type in self.board.get_forbidden_zone_cells(cells)
+        ]
+
+    def get_placement_cells(self):
+        for shape in HalfCellFigures.get_fixed(self.variables["s"]):
+            for row in range(self.grid_size):
+                for col in range(self.grid_size):
+                    cells = [((r + row, c + col), cell_type) for r, c, cell_type in shape]
+                    if all(self.board.in_bounds(r, c) for (r, c), cell_type in cells):
+                        yield cells
+
+    def get_full_mask(self):
+        full = 0
+        for placement in self.placements:
+            full |= placement[0]
+        return full
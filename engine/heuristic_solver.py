@@ -0,0 +1,267 @@
+import bisect
+import math
+import random
+import time
+
+from engine.half_cell_solver import HalfCellSolver
+from engine.packing_solver import PackingSolver
+from engine.polyiamond_solver import PolyiamondSolver
+from engine.polyomino_solver import PolyominoSolver
+from utils.constants import Constants
+
+
+class HeuristicSolver:
+    EXACT = False
+    SUPPORTED_TASKS = ["1a", "1b", "1c", "2a", "3a", "3b", "4.1a", "4.1b", "4.1c"]
+    PLACEMENT_SOLVERS = [PackingSolver, PolyominoSolver, HalfCellSolver, PolyiamondSolver]
+    RESTART_SHARE = 0.2
+    BAND_ROWS = 2
+    NOISE = 2.0
+    START_TEMPERATURE = 0.5
+    REPAIR_LIMIT = 20000
+    BUILD_SHARE = 0.5
+
+    def __init__(self, grid_size, task, variables, time_limit=None, seed=None):
+        if task not in self.SUPPORTED_TASKS:
+            raise ValueError(f'Пункт {task} не поддерживается эвристическим поиском')
+
+        solver_class = next(solver for solver in self.PLACEMENT_SOLVERS if task in solver.SUPPORTED_TASKS)
+        self.placement_solver = solver_class(grid_size, task, variables)
+        self.grid_size = grid_size
+        self.task = task
+        self.variables = variables
+        self.time_limit = Constants.HEURISTIC_TIME_LIMIT if time_limit is None else time_limit
+        self.random = random.Random(seed)
+        self.board = self.placement_solver.board
+        self.buckets = {}
+        self.bucket_cells = []
+        self.full_mask = 0
+        self.best_placements = []
+        self.optimal = False
+
+    def build_placements(self, is_stopped):
+        placements_by_cell = {}
+        cell_indices_seen = set()
+
+        for count, (cells, cell_indices, zone_indices) in enumerate(self.placement_solver.iter_placements()):
+            if count & 255 == 0 and is_stopped():
+                break
+
+            base = min(cell_indices + zone_indices)
+            cells_mask = PackingSolver.get_mask(index - base for index in cell_indices)
+            block_mask = cells_mask | PackingSolver.get_mask(index - base for index in zone_indices)
+            placements_by_cell.setdefault(min(cell_indices), []).append((cells_mask, block_mask, cells, base))
+            cell_indices_seen.update(cell_indices)
+
+        self.buckets = {}
+        for cell, placements in placements_by_cell.items():
+            base = min(placement[3] for placement in placements)
+            placements = [
+                (cells_mask << (own_base - base), block_mask << (own_base - base), cells, base)
+                for cells_mask, block_mask, cells, own_base in placements
+            ]
+            reach = 0
+            for placement in placements:
+                reach |= placement[1]
+            self.buckets[cell] = (base, reach, placements)
+
+        self.bucket_cells = sorted(self.buckets)
+        self.full_mask = PackingSolver.get_mask(cell_indices_seen)
+        self.bit_count = self.full_mask.bit_length()
+        self.row_bits = max(1, self.bit_count // max(1, self.grid_size))
+        self.band_bits = self.row_bits * self.BAND_ROWS
+
+    def get_first_bit(self, placement):
+        return placement[3] + (placement[0] & -placement[0]).bit_length() - 1
+
+    @staticmethod
+    def shift_mask(mask, shift):
+        return mask << shift if shift >= 0 else mask >> -shift
+
+    def remove_block(self, available, placement):
+        return available & ~(placement[1] << placement[3])
+
+    def choose(self, candidates, available):
+        return min(
+            candidates,
+            key=lambda placement: bin(placement[1] & available).count("1") + self.random.random() * self.NOISE
+        )
+
+    def fill(self, available, placements, is_stopped, start=0, stop=None):
+        window = available >> start << start
+        if stop is not None:
+            window &= (1 << stop) - 1
+
+        steps = 0
+        while window:
+            steps += 1
+            if steps & 63 == 0 and is_stopped():
+                break
+
+            lowest = window & -window
+            bucket = self.buckets.get(lowest.bit_length() - 1)
+            if bucket is None:
+                window ^= lowest
+                continue
+
+            base, reach, bucket_placements = bucket
+            local = (available >> base) & reach
+            candidates = [placement for placement in bucket_placements if placement[0] & local == placement[0]]
+            if not candidates:
+                window ^= lowest
+                continue
+
+            placement = self.choose(candidates, local)
+            placements.append(placement)
+            available = self.remove_block(available, placement)
+            window &= available
+
+        return available
+
+    def repair(self, available, start, stop, is_stopped):
+        first = bisect.bisect_left(self.bucket_cells, start)
+        last = bisect.bisect_left(self.bucket_cells, stop)
+        local_buckets = {}
+        width = stop - start
+        for cell in self.bucket_cells[first:last]:
+            base, reach, bucket_placements = self.buckets[cell]
+            shift = base - start
+            local_buckets[cell - start] = [
+                (self.shift_mask(placement[0], shift), self.shift_mask(placement[1], shift), placement)
+                for placement in bucket_placements
+            ]
+            width = max(width, shift + reach.bit_length())
+
+        stop_bit = 1 << (stop - start)
+        memo = {}
+
+        def get_branches(state):
+            while state and state & -state < stop_bit:
+                lowest = state & -state
+                candidates = [
+                    placement for placement in local_buckets.get(lowest.bit_length() - 1, [])
+                    if placement[0] & state == placement[0]
+                ]
+                if candidates:
+                    self.random.shuffle(candidates)
+                    branches = [(placement, state & ~placement[1]) for placement in candidates]
+                    branches.append((None, state ^ lowest))
+                    return state, branches
+                state ^= lowest
+            return None, []
+
+        def open_frame(state, stack):
+            key, branches = get_branches(state)
+            if key is None:
+                return 0
+
+            cached = memo.get(key)
+            if cached is not None:
+                return cached[0]
+
+            if len(stack) + len(memo) > self.REPAIR_LIMIT:
+                raise TimeoutError('Превышен размер окна')
+            if len(memo) & 255 == 0 and is_stopped():
+                raise TimeoutError('Поиск решения остановлен')
+
+            stack.append([key, branches, 0, -1, None])
+            return None
+
+        state = (available >> start) & ((1 << width) - 1)
+        stack = []
+        value = open_frame(state, stack)
+        while stack:
+            frame = stack[-1]
+            key, branches, index, best, best_placement = frame
+
+            if value is not None:
+                placement = branches[index][0]
+                if placement is not None:
+                    value += 1
+                if value > best:
+                    best, best_placement = value, placement
+                    frame[3], frame[4] = best, best_placement
+                index += 1
+                frame[2] = index
+
+            if index == len(branches):
+                stack.pop()
+                memo[key] = (best, best_placement)
+                value = best
+                continue
+
+            value = open_frame(branches[index][1], stack)
+
+        placements = []
+        while True:
+            key, branches = get_branches(state)
+            if key is None:
+                return placements
+
+            placement = memo[key][1]
+            state = next(child for branch_placement, child in branches if branch_placement is placement)
+            if placement is not None:
+                placements.append(placement[2])
+
+    def build_neighbour(self, placements, is_stopped):
+        start = max(0, self.random.randrange(-self.band_bits, self.bit_count))
+        stop = start + self.band_bits
+
+        kept = [placement for placement in placements if not start <= self.get_first_bit(placement) < stop]
+        available = self.full_mask
+        for placement in kept:
+            available = self.remove_block(available, placement)
+
+        try:
+            kept.extend(self.repair(available, start, stop, is_stopped))
+            self.band_bits = max(1, min(self.bit_count, self.band_bits + 1))
+        except TimeoutError:
+            self.fill(available, kept, is_stopped, start, stop)
+            self.band_bits = max(self.row_bits, self.band_bits * 3 // 4)
+        return kept
+
+    def get_temperature(self, started):
+        return self.START_TEMPERATURE * max(0.0, 1 - (time.monotonic() - started) / self.time_limit)
+
+    def solve(self, on_improve=None, is_cancelled=None):
+        started = time.monotonic()
+        deadline = started + self.time_limit
+        self.best_placements = []
+
+        def is_stopped(limit=deadline):
+            return time.monotonic() > limit or (is_cancelled is not None and is_cancelled())
+
+        self.build_placements(lambda: is_stopped(started + self.time_limit * self.BUILD_SHARE))
+        if not self.full_mask:
+            return self.get_figures()
+
+        built = time.monotonic()
+        restart_deadline = built + max(0.0, deadline - built) * self.RESTART_SHARE
+
+        def update_best(placements):
+            if len(placements) <= len(self.best_placements):
+                return
+            self.best_placements = list(placements)
+            if on_improve is not None:
+                on_improve(self.get_figures())
+
+        while True:
+            placements = []
+            self.fill(self.full_mask, placements, is_stopped)
+            update_best(placements)
+            if is_stopped(restart_deadline):
+                break
+
+        current = list(self.best_placements)
+        while not is_stopped():
+            candidate = self.build_neighbour(current, is_stopped)
+            delta = len(candidate) - len(current)
+            temperature = self.get_temperature(started)
+            if delta >= 0 or (temperature > 0 and self.random.random() < math.exp(delta / temperature)):
+                current = candidate
+                update_best(current)
+
+        return self.get_figures()
+
+    def get_figures(self):
+        return [placement[2] for placement in self.best_placements]
@@ -0,0 +1,97 @@
+import codecs
+import json
+import re
+
+
+class JsonStreamReader:
+    CHUNK_SIZE = 1 << 20
+    WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, file):
+        self.file = file
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.position = 0
+        self.bytes_read = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+
+        chunk = self.file.read(self.CHUNK_SIZE)
+        self.bytes_read += len(chunk)
+        if not chunk:
+            self.eof = True
+
+        self.buffer = self.buffer[self.position:] + self.text_decoder.decode(chunk, final=self.eof)
+        self.position = 0
+        return True
+
+    def peek(self):
+        while True:
+            self.position = self.WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill():
+                raise ValueError('Неожиданный конец файла')
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f'Ожидался символ {char!r} в позиции {self.bytes_read}')
+        self.position += 1
+
+    def read_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise ValueError('Некорректный JSON')
+            self.fill()
+
+    def iterate_array(self):
+        self.expect('[')
+        if self.peek() == ']':
+            self.position += 1
+            return
+
+        while True:
+            yield self.read_value()
+            if self.peek() == ',':
+                self.position += 1
+            else:
+                self.expect(']')
+                return
+
+    def iterate_object(self):
+        self.expect('{')
+        if self.peek() == '}':
+            self.position += 1
+            return
+
+        while True:
+            key = self.read_value()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.position += 1
+            else:
+                self.expect('}')
+                return
+
+    def skip_value(self):
+        char = self.peek()
+        if char == '[':
+            for item in self.iterate_array():
+                pass
+        elif char == '{':
+            for key in self.iterate_object():
+                self.skip_value()
+        else:
+            self.read_value()
@@ -0,0 +1,231 @@
+import time
+
+from engine.board_factory import BoardFactory
+
+
+class PackingSolver:
+    EXACT = True
+    SUPPORTED_TASKS = ["1a", "1b", "4.1a", "4.1b"]
+    MEMO_LIMIT = 200000
+
+    def __init__(self, grid_size, task, variables, time_limit=None):
+        if task not in self.SUPPORTED_TASKS:
+            raise ValueError(f'Пункт {task} не поддерживается точным решателем')
+
+        self.grid_size = grid_size
+        self.task = task
+        self.variables = variables
+        self.time_limit = time_limit
+        self.board = BoardFactory.create_board(grid_size, task, variables)
+        self.stride = grid_size + 1
+        self.min_cells = 1
+        self.placements = []
+        self.placements_by_cell = [[] for _ in range(self.get_cell_count())]
+        self.memo = {}
+        self.deadline = None
+        self.is_cancelled = None
+        self.best_count = 0
+        self.best_placements = []
+        self.optimal = False
+
+    def get_cell_count(self):
+        return self.grid_size * self.stride
+
+    def cell_index(self, row, col):
+        return row * self.stride + col
+
+    @staticmethod
+    def get_mask(indices):
+        mask = 0
+        for index in indices:
+            mask |= 1 << index
+        return mask
+
+    def get_placement_cells(self):
+        seen = set()
+
+        for rotation in range(4):
+            for row in range(self.grid_size):
+                for col in range(self.grid_size):
+                    if not self.board.can_place_figure(row, col, rotation):
+                        continue
+
+                    cells = self.board.get_figure_cells(row, col, rotation)
+                    key = frozenset(coord for coord, cell_type in cells)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    yield cells
+
+    def get_cell_indices(self, cells):
+        return [self.cell_index(r, c) for (r, c), cell_type in cells]
+
+    def get_zone_indices(self, cells):
+        return [self.cell_index(r, c) for (r, c), forbidden_type in self.board.get_forbidden_zone_cells(cells)]
+
+    def iter_placements(self):
+        for cells in self.get_placement_cells():
+            yield cells, self.get_cell_indices(cells), self.get_zone_indices(cells)
+
+    def create_placement(self, cells, cell_indices, zone_indices):
+        cells_mask = self.get_mask(cell_indices)
+        return cells_mask, cells_mask | self.get_mask(zone_indices), cells
+
+    def add_placement(self, placement):
+        self.placements.append(placement)
+        first_cell = (placement[0] & -placement[0]).bit_length() - 1
+        self.placements_by_cell[first_cell].append(placement)
+        if len(self.placements) & 1023 == 0:
+            self.check_deadline()
+
+    def build_placements(self):
+        self.placements = []
+        self.placements_by_cell = [[] for _ in range(self.get_cell_count())]
+        for cells, cell_indices, zone_indices in self.iter_placements():
+            self.add_placement(self.create_placement(cells, cell_indices, zone_indices))
+        self.min_cells = min((bin(placement[0]).count("1") for placement in self.placements), default=1)
+
+    def get_full_mask(self):
+        row_mask = (1 << self.grid_size) - 1
+        full = 0
+        for row in range(self.grid_size):
+            full |= row_mask << (row * self.stride)
+        return full
+
+    def next_branch(self, available):
+        while available:
+            lowest = available & -available
+            candidates = [
+                placement for placement in self.placements_by_cell[lowest.bit_length() - 1]
+                if placement[0] & available == placement[0]
+            ]
+            if candidates:
+                return available, lowest, candidates
+            available ^= lowest
+        return 0, 0, []
+
+    def get_initial_state(self):
+        return self.get_full_mask()
+
+    def get_branches(self, state):
+        available, lowest, candidates = self.next_branch(state)
+        if not available:
+            return None, []
+
+        branches = [(placement, available & ~placement[1]) for placement in candidates]
+        branches.append((None, available ^ lowest))
+        return available, branches
+
+    def check_deadline(self):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise TimeoutError('Превышено время поиска решения')
+        if self.is_cancelled is not None and self.is_cancelled():
+            raise TimeoutError('Поиск решения остановлен')
+
+    def solve(self, on_improve=None, is_cancelled=None):
+        self.deadline = None if self.time_limit is None else time.monotonic() + self.time_limit
+        self.on_improve = on_improve
+        self.is_cancelled = is_cancelled
+        self.memo = {}
+        self.path = []
+        self.visited = 0
+        self.best_count = 0
+        self.best_placements = []
+        self.optimal = False
+
+        self.build_placements()
+        self.search(self.get_initial_state())
+        self.optimal = True
+        return self.get_figures()
+
+    def get_state_cells(self, state):
+        return state
+
+    def get_upper_bound(self, state):
+        return bin(self.get_state_cells(state)).count("1") // self.min_cells
+
+    @staticmethod
+    def unpack(layout):
+        placements = []
+        while layout is not None:
+            placement, layout = layout
+            placements.append(placement)
+        return placements
+
+    def report(self, count, layout):
+        if len(self.path) + count <= self.best_count:
+            return
+
+        self.best_count = len(self.path) + count
+        self.best_placements = self.path + self.unpack(layout)
+        if self.on_improve is not None:
+            self.on_improve(self.get_figures())
+
+    def remember(self, key, count, layout, bound):
+        if len(self.memo) >= self.MEMO_LIMIT:
+            self.memo.clear()
+        self.memo[key] = (count, layout, bound)
+
+    def open_frame(self, state, stack):
+        key, branches = self.get_branches(state)
+        if key is None:
+            self.report(0, None)
+            return 0, None, True
+
+        cached = self.memo.get(key)
+        if cached is not None:
+            count, layout, bound = cached
+            if count == bound or len(self.path) + bound <= self.best_count:
+                self.report(count, layout)
+                return count, layout, count == bound
+        else:
+            bound = self.get_upper_bound(key)
+
+        if len(self.path) + bound <= self.best_count:
+            return 0, None, False
+
+        self.visited += 1
+        if self.visited & 1023 == 0:
+            self.check_deadline()
+
+        stack.append([key, branches, 0, -1, None, True, bound])
+        return None
+
+    def search(self, state):
+        stack = []
+        result = self.open_frame(state, stack)
+
+        while stack:
+            frame = stack[-1]
+            key, branches, index, best, best_layout, exact, bound = frame
+
+            if result is not None:
+                value, layout, child_exact = result
+                placement = branches[index][0]
+                if placement is not None:
+                    self.path.pop()
+                    value += 1
+                    layout = (placement, layout)
+                if value > best:
+                    best, best_layout = value, layout
+                exact = exact and child_exact
+                index += 1
+                frame[2:6] = index, best, best_layout, exact
+
+            if index == len(branches) or best >= bound:
+                stack.pop()
+                bound = best if exact else min(bound, max(best, self.best_count - len(self.path)))
+                self.remember(key, best, best_layout, bound)
+                self.report(best, best_layout)
+                result = best, best_layout, exact
+                continue
+
+            placement, child = branches[index]
+            if placement is not None:
+                self.path.append(placement)
+            result = self.open_frame(child, stack)
+
+        return result[0]
+
+    def get_figures(self):
+        return [placement[2] for placement in self.best_placements]
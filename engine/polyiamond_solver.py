@@ -0,0 +1,86 @@
+from engine.packing_solver import PackingSolver
+from engine.polyiamonds import Polyiamonds
+
+
+class PolyiamondSolver(PackingSolver):
+    SUPPORTED_TASKS = ["3a", "3b", "4.3a", "4.3b"]
+
+    def get_cell_count(self):
+        return self.grid_size * self.grid_size
+
+    def cell_index(self, row, col):
+        return self.board.cell_index(row, col)
+
+    def get_full_mask(self):
+        return (1 << self.get_cell_count()) - 1
+
+    def get_shapes(self):
+        if self.task in ["3a", "4.3a"]:
+            return [
+                Polyiamonds.normalize([(row, col + rotation) for row, col in self.board.get_rotated_figure(rotation)])
+                for rotation in range(2)
+            ]
+        return Polyiamonds.get_fixed(self.variables["s"])
+
+    def get_placement_cells(self):
+        for shape in self.get_shapes():
+            for row in range(self.grid_size):
+                for shift in range(0, 2 * self.grid_size, 2):
+                    coords = [(r + row, c + shift) for r, c in shape]
+                    if all(self.board.in_bounds(r, c) for r, c in coords):
+                        yield [(coord, 0) for coord in coords]
+
+    def create_placement(self, cells, cell_indices, zone_indices):
+        points = 0
+        for point in self.board.get_figure_boundary_points(cells):
+            points |= 1 << point
+        return super().create_placement(cells, cell_indices, zone_indices) + (points,)
+
+    def build_placements(self):
+        self.max_common_points = self.board.get_max_common_points()
+        self.vertex_floor = [
+            row * (row + 1) // 2 + col // 2
+            for row, col in map(self.board.cell_coord, range(self.get_cell_count()))
+        ]
+        super().build_placements()
+
+    def get_live_touching(self, lowest, touching):
+        if not touching:
+            return touching
+
+        live = -1 << self.vertex_floor[lowest.bit_length() - 1]
+        return tuple(sorted(
+            points & live for points in touching
+            if bin(points & live).count("1") > self.max_common_points
+        ))
+
+    def add_touching(self, touching, placement):
+        if not self.max_common_points:
+            return touching
+        return touching + (placement[3],)
+
+    def is_compatible(self, placement, touching):
+        return all(
+            bin(placement[3] & points).count("1") <= self.max_common_points
+            for points in touching
+        )
+
+    def get_initial_state(self):
+        return self.get_full_mask(), ()
+
+    def get_state_cells(self, state):
+        return state[0]
+
+    def get_branches(self, state):
+        available, touching = state
+        available, lowest, candidates = self.next_branch(available)
+        if not available:
+            return None, []
+
+        touching = self.get_live_touching(lowest, touching)
+        branches = [
+            (placement, (available & ~placement[1], self.add_touching(touching, placement)))
+            for placement in candidates if self.is_compatible(placement, touching)
+        ]
+        branches.append((None, (available ^ lowest, touching)))
+        return (available, touching), branches
@@ -0,0 +1,133 @@
+import json
+import os
+
+from engine.triangle_board import TriangleBoard
+from utils.constants import Constants
+
+
+class Polyiamonds:
+    free_cache = {}
+
+    @staticmethod
+    def normalize(cells):
+        min_row = min(row for row, col in cells)
+        shift = min(col for row, col in cells) // 2 * 2
+        return tuple(sorted([(row - min_row, col - shift) for row, col in cells]))
+
+    @staticmethod
+    def to_centroid(cell):
+        row, col = cell
+        if col & 1:
+            return 3 * (col // 2) + 2, 3 * row + 1
+        return 3 * (col // 2) + 1, 3 * row + 2
+
+    @staticmethod
+    def from_centroid(x, y):
+        if y % 3 == 1:
+            return (y - 1) // 3, 2 * ((x - 2) // 3) + 1
+        return (y - 2) // 3, 2 * ((x - 1) // 3)
+
+    @staticmethod
+    def rotate(cells, rotations=1):
+        rotated = list(cells)
+        for _ in range(rotations % 6):
+            rotated = [
+                Polyiamonds.from_centroid(x - y, x)
+                for x, y in map(Polyiamonds.to_centroid, rotated)
+            ]
+        return rotated
+
+    @staticmethod
+    def mirror(cells):
+        return [
+            Polyiamonds.from_centroid(y - x, y)
+            for x, y in map(Polyiamonds.to_centroid, cells)
+        ]
+
+    @staticmethod
+    def get_orientations(cells):
+        orientations = set()
+        for figure in (list(cells), Polyiamonds.mirror(cells)):
+            for rotations in range(6):
+                orientations.add(Polyiamonds.normalize(Polyiamonds.rotate(figure, rotations)))
+        return sorted(orientations)
+
+    @staticmethod
+    def canonical(cells):
+        return Polyiamonds.get_orientations(cells)[0]
+
+    @staticmethod
+    def enumerate_fixed(size):
+        if size < 1:
+            return
+
+        polyiamond = []
+
+        def extend(untried, seen, start):
+            while untried:
+                cell = untried.pop()
+                polyiamond.append(cell)
+
+                if len(polyiamond) == size:
+                    yield tuple(polyiamond)
+                else:
+                    row, col = cell
+                    new_cells = [
+                        (row + dr, col + dc) for dr, dc in TriangleBoard.EDGE_NEIGHBOURS[col & 1]
+                        if (row + dr, col + dc) >= start and (row + dr, col + dc) not in seen
+                    ]
+                    yield from extend(untried + new_cells, seen.union(new_cells), start)
+
+                polyiamond.pop()
+
+        for start in [(0, 0), (0, 1)]:
+            yield from extend([start], {start}, start)
+
+    @staticmethod
+    def enumerate_free(size):
+        shapes = []
+        for cells in Polyiamonds.enumerate_fixed(size):
+            normalized = Polyiamonds.normalize(cells)
+            if Polyiamonds.canonical(normalized) == normalized:
+                shapes.append(normalized)
+        return sorted(shapes)
+
+    @staticmethod
+    def get_cache_path(size):
+        return os.path.join(Constants.CACHE_DIR, "polyiamonds", f"{size}.json")
+
+    @staticmethod
+    def get_free(size):
+        shapes = Polyiamonds.free_cache.get(size)
+        if shapes is not None:
+            return shapes
+
+        path = Polyiamonds.get_cache_path(size)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                shapes = [tuple((row, col) for row, col in shape) for shape in json.load(f)]
+        except (OSError, ValueError):
+            shapes = Polyiamonds.enumerate_free(size)
+            Polyiamonds.save_cache(path, shapes)
+
+        Polyiamonds.free_cache[size] = shapes
+        return shapes
+
+    @staticmethod
+    def get_fixed(size):
+        return [
+            orientation
+            for shape in Polyiamonds.get_free(size)
+            for orientation in Polyiamonds.get_orientations(shape)
+        ]
+
+    @staticmethod
+    def save_cache(path, shapes):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump([[list(cell) for cell in shape] for shape in shapes], f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
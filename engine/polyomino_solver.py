@@ -0,0 +1,14 @@
+from engine.packing_solver import PackingSolver
+from engine.polyominoes import Polyominoes
+
+
+class PolyominoSolver(PackingSolver):
+    SUPPORTED_TASKS = ["1c", "4.1c"]
+
+    def get_placement_cells(self):
+        for shape in Polyominoes.get_fixed(self.variables["s"]):
+            for row in range(self.grid_size):
+                for col in range(self.grid_size):
+                    cells = [((r + row, c + col), 0) for r, c in shape]
+                    if all(self.board.in_bounds(r, c) for (r, c), cell_type in cells):
+                        yield cells
@@ -0,0 +1,113 @@
+import json
+import os
+
+from utils.constants import Constants
+from utils.figure_manager import FigureManager
+
+
+class Polyominoes:
+    free_cache = {}
+
+    @staticmethod
+    def normalize(cells):
+        rows, cols = zip(*cells)
+        min_row = min(rows)
+        min_col = min(cols)
+        return tuple(sorted([(row - min_row, col - min_col) for row, col in cells]))
+
+    @staticmethod
+    def get_orientations(cells):
+        orientations = set()
+        for figure in (list(cells), FigureManager.mirror_figure(cells)):
+            for rotations in range(4):
+                orientations.add(Polyominoes.normalize(FigureManager.rotate_figure(figure, rotations)))
+        return sorted(orientations)
+
+    @staticmethod
+    def canonical(cells):
+        mirrored = FigureManager.mirror_figure(cells)
+        return min(
+            Polyominoes.normalize(FigureManager.rotate_figure(figure, rotations))
+            for figure in (list(cells), mirrored)
+            for rotations in range(4)
+        )
+
+    @staticmethod
+    def enumerate_fixed(size):
+        if size < 1:
+            return
+
+        polyomino = []
+
+        def allowed(cell):
+            row, col = cell
+            return row > 0 or (row == 0 and col >= 0)
+
+        def extend(untried, seen):
+            while untried:
+                cell = untried.pop()
+                polyomino.append(cell)
+
+                if len(polyomino) == size:
+                    yield tuple(polyomino)
+                else:
+                    row, col = cell
+                    new_cells = [
+                        neighbour for neighbour in
+                        ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+                        if allowed(neighbour) and neighbour not in seen
+                    ]
+                    yield from extend(untried + new_cells, seen.union(new_cells))
+
+                polyomino.pop()
+
+        yield from extend([(0, 0)], {(0, 0)})
+
+    @staticmethod
+    def enumerate_free(size):
+        shapes = []
+        for cells in Polyominoes.enumerate_fixed(size):
+            normalized = Polyominoes.normalize(cells)
+            if Polyominoes.canonical(normalized) == normalized:
+                shapes.append(normalized)
+        return sorted(shapes)
+
+    @staticmethod
+    def get_cache_path(size):
+        return os.path.join(Constants.CACHE_DIR, "polyominoes", f"{size}.json")
+
+    @staticmethod
+    def get_free(size):
+        shapes = Polyominoes.free_cache.get(size)
+        if shapes is not None:
+            return shapes
+
+        path = Polyominoes.get_cache_path(size)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                shapes = [tuple((row, col) for row, col in shape) for shape in json.load(f)]
+        except (OSError, ValueError):
+            shapes = Polyominoes.enumerate_free(size)
+            Polyominoes.save_cache(path, shapes)
+
+        Polyominoes.free_cache[size] = shapes
+        return shapes
+
+    @staticmethod
+    def get_fixed(size):
+        return [
+            orientation
+            for shape in Polyominoes.get_free(size)
+            for orientation in Polyominoes.get_orientations(shape)
+        ]
+
+    @staticmethod
+    def save_cache(path, shapes):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump([[list(cell) for cell in shape] for shape in shapes], f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
@@ -0,0 +1,210 @@
+import math
+import struct
+import zlib
+
+from engine.board import Board
+
+
+class BoardRaster:
+    SCREEN_COLORS = [
+        (0, 0, 0, 0),
+        (255, 0, 0, 80),
+        (0, 0, 255, 180),
+        (0, 0, 255, 180),
+        (0, 255, 0, 180),
+        (255, 255, 0, 180)
+    ]
+    EXPORT_COLORS = [
+        (255, 255, 255, 255),
+        (255, 175, 175, 255),
+        (75, 75, 255, 255),
+        (75, 75, 255, 255),
+        (75, 255, 75, 255),
+        (255, 255, 75, 255)
+    ]
+    GRID_COLOR = (0, 0, 0, 255)
+    GRID_MIN_TILE = 4
+
+    @staticmethod
+    def covers(cell_type, x, y):
+        if cell_type == 1:
+            return x + y <= 1
+        elif cell_type == 2:
+            return y <= x
+        elif cell_type == 3:
+            return y >= x
+        elif cell_type == 4:
+            return x + y >= 1
+        elif cell_type == 5:
+            return y <= x and y <= 1 - x
+        elif cell_type == 6:
+            return x >= y and x >= 1 - y
+        elif cell_type == 7:
+            return y >= x and y >= 1 - x
+        elif cell_type == 8:
+            return x <= y and x <= 1 - y
+        return True
+
+    @staticmethod
+    def build_tile(tile, layers, background, grid):
+        rows = []
+        for i in range(tile):
+            row = bytearray()
+            for j in range(tile):
+                if grid and (i == 0 or j == 0):
+                    color = BoardRaster.GRID_COLOR
+                else:
+                    color = background
+                    x = (j + 0.5) / tile
+                    y = (i + 0.5) / tile
+                    for cell_type, layer_color in layers:
+                        if BoardRaster.covers(cell_type, x, y):
+                            color = layer_color
+                row.extend(color)
+            rows.append(bytes(row))
+        return rows
+
+    @staticmethod
+    def render(board, tile=1, bounds=None, violating_figures=(), colors=None, grid=False):
+        colors = colors or BoardRaster.EXPORT_COLORS
+        grid_size = board.grid_size
+        if bounds is None:
+            bounds = (0, 0, grid_size - 1, grid_size - 1)
+        min_row, min_col, max_row, max_col = bounds
+
+        states = board.get_cell_states(violating_figures)
+        regions = [
+            states[row * grid_size + min_col:row * grid_size + max_col + 1]
+            for row in range(min_row, max_row + 1)
+        ]
+
+        if tile == 1:
+            return BoardRaster.render_flat(b''.join(regions), max_col - min_col + 1, len(regions), colors)
+
+        grid = grid and tile >= BoardRaster.GRID_MIN_TILE
+        columns = max_col - min_col + 1
+        width = columns * tile + (1 if grid else 0)
+        tiles = {}
+        pixels = bytearray()
+
+        for row in range(min_row, max_row + 1):
+            keys = []
+            for col in range(min_col, max_col + 1):
+                index = row * grid_size + col
+                keys.append((states[index], board.occupancy[index], board.forbidden_mask[index]))
+
+            for key in set(keys):
+                if key not in tiles:
+                    tiles[key] = BoardRaster.build_tile(tile, BoardRaster.get_layers(key, colors), colors[0], grid)
+
+            for i in range(tile):
+                pixels.extend(b''.join(tiles[key][i] for key in keys))
+                if grid:
+                    pixels.extend(BoardRaster.GRID_COLOR)
+
+        height = len(regions) * tile
+        if grid:
+            pixels.extend(bytes(BoardRaster.GRID_COLOR) * width)
+            height += 1
+
+        return width, height, pixels
+
+    @staticmethod
+    def render_lattice(board, violating_figures=(), colors=None):
+        colors = colors or BoardRaster.EXPORT_COLORS
+        grid_size = board.grid_size
+        width = 2 * grid_size - 1
+        states = board.get_cell_states(violating_figures)
+
+        rows = []
+        for row in range(grid_size):
+            padding = bytes(grid_size - 1 - row)
+            rows.append(padding + bytes(states[row * row:(row + 1) * (row + 1)]) + padding)
+
+        return BoardRaster.render_flat(b''.join(rows), width, grid_size, colors)
+
+    @staticmethod
+    def render_lattice_tiles(board, tile, violating_figures=(), colors=None, grid=False):
+        colors = colors or BoardRaster.EXPORT_COLORS
+        grid_size = board.grid_size
+        row_height = tile * math.sqrt(3) / 2
+        width = grid_size * tile + 1
+        height = math.ceil(grid_size * row_height) + 1
+        grid = grid and tile >= BoardRaster.GRID_MIN_TILE
+        line_width = 1 / row_height
+        states = board.get_cell_states(violating_figures)
+        outside = bytes(4)
+        palette = [bytes(color) for color in colors]
+        grid_color = bytes(BoardRaster.GRID_COLOR)
+
+        pixels = bytearray()
+        for y in range(height):
+            position_y = (y + 0.5) / row_height
+            row = math.floor(position_y)
+            fraction_y = position_y - row
+            start = row * row
+            for x in range(width):
+                position_x = (x + 0.5) / tile - grid_size / 2 + position_y / 2
+                column = math.floor(position_x)
+                fraction_x = position_x - column
+
+                if (grid and -line_width <= position_x <= position_y + line_width
+                        and position_y <= grid_size + line_width
+                        and (fraction_y < line_width or fraction_x < line_width
+                             or (fraction_x - fraction_y) % 1 < line_width)):
+                    pixels.extend(grid_color)
+                elif 0 <= position_x <= position_y < grid_size:
+                    col = 2 * column + (1 if fraction_x > fraction_y else 0)
+                    pixels.extend(palette[states[start + col]])
+                else:
+                    pixels.extend(outside)
+
+        return width, height, pixels
+
+    @staticmethod
+    def get_layers(key, colors):
+        state, value, mask = key
+        layers = [
+            (zone_type, colors[1])
+            for zone_type, bit in Board.FORBIDDEN_BITS.items()
+            if mask & bit
+        ]
+        if value:
+            layers.append((value - 1, colors[state]))
+        return layers
+
+    @staticmethod
+    def render_flat(states, width, height, colors):
+        pixels = bytearray(len(states) * 4)
+        for channel in range(4):
+            table = bytes(colors[state][channel] if state < len(colors) else 0 for state in range(256))
+            pixels[channel::4] = states.translate(table)
+        return width, height, pixels
+
+    @staticmethod
+    def png_chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    @staticmethod
+    def encode_png(width, height, pixels):
+        stride = width * 4
+        raw = b''.join(
+            b'\x00' + bytes(pixels[row * stride:(row + 1) * stride])
+            for row in range(height)
+        )
+        return (
+            b'\x89PNG\r\n\x1a\n'
+            + BoardRaster.png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+            + BoardRaster.png_chunk(b'IDAT', zlib.compress(raw, 6))
+            + BoardRaster.png_chunk(b'IEND', b'')
+        )
+
+    @staticmethod
+    def export_png(board, file_path, tile=8):
+        violating_figures = board.check_figures_touching()
+        if board.is_lattice_task():
+            width, height, pixels = BoardRaster.render_lattice_tiles(board, tile, violating_figures, grid=True)
+        else:
+            width, height, pixels = BoardRaster.render(board, tile, violating_figures=violating_figures, grid=True)
+        with open(file_path, 'wb') as f:
+            f.write(BoardRaster.encode_png(width, height, pixels))
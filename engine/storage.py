@@ -0,0 +1,215 @@
+import json
+import os
+import struct
+import zlib
+
+from engine.board import Board
+from engine.board_factory import BoardFactory
+from engine.json_stream import JsonStreamReader
+from utils.constants import Constants
+
+
+class BoardStorage:
+    REQUIRED_FIELDS = ['grid_size', 'current_task', 'variables', 'current_rotation']
+    BINARY_MAGIC = b'TASK4BIN'
+    BINARY_VERSION = 2
+    FIGURE_SIZE_FORMATS = {1: '>H', 2: '>I'}
+    BINARY_EXTENSION = '.t4b'
+    PROGRESS_STEP = 10000
+
+    @staticmethod
+    def board_to_data(board, rotation=0):
+        placed_figures = [] if board.is_cell_task() else board.placed_figures
+        return {
+            'grid_size': board.grid_size,
+            'current_task': board.current_task,
+            'variables': dict(board.variables),
+            'placed_figures': [tuple(figure) for figure in placed_figures],
+            'placed_cells': list(board.placed_cells),
+            'current_rotation': rotation
+        }
+
+    @staticmethod
+    def data_to_board(data):
+        board = BoardFactory.create_board(data['grid_size'], data['current_task'], data['variables'])
+        board.load_state(data.get('placed_figures', []), data.get('placed_cells', []))
+        return board
+
+    @staticmethod
+    def is_binary_path(file_path):
+        return file_path.lower().endswith(BoardStorage.BINARY_EXTENSION)
+
+    @staticmethod
+    def encode_binary(data):
+        grid_size = data['grid_size']
+        task = data['current_task'].encode('utf-8')
+        variables = data['variables']
+
+        body = bytearray(struct.pack('>B', len(task)) + task)
+        body += struct.pack('>IIIB', grid_size, variables['s'], variables['t'], data['current_rotation'])
+
+        layout = BoardFactory.create_board(grid_size, data['current_task'])
+        grid = bytearray(grid_size * grid_size)
+        for (row, col), cell_type in data.get('placed_cells', []):
+            grid[layout.cell_index(row, col)] = cell_type + 1
+        body += grid
+
+        figures = [] if data['current_task'] in Board.CELL_TASKS else data.get('placed_figures', [])
+        body += struct.pack('>I', len(figures))
+        for figure in figures:
+            body += struct.pack(BoardStorage.FIGURE_SIZE_FORMATS[BoardStorage.BINARY_VERSION], len(figure))
+            body += struct.pack(f'>{len(figure)}I', *[layout.cell_index(row, col) for (row, col), cell_type in figure])
+            body += bytes(cell_type for coord, cell_type in figure)
+
+        return BoardStorage.BINARY_MAGIC + struct.pack('>B', BoardStorage.BINARY_VERSION) + zlib.compress(bytes(body))
+
+    @staticmethod
+    def decode_binary(raw):
+        try:
+            version = raw[len(BoardStorage.BINARY_MAGIC)]
+            size_format = BoardStorage.FIGURE_SIZE_FORMATS.get(version)
+            if size_format is None:
+                raise ValueError(f'Неподдерживаемая версия формата: {version}')
+
+            body = zlib.decompress(raw[len(BoardStorage.BINARY_MAGIC) + 1:])
+
+            task_length = body[0]
+            task = body[1:1 + task_length].decode('utf-8')
+            offset = 1 + task_length
+            grid_size, s, t, rotation = struct.unpack_from('>IIIB', body, offset)
+            offset += struct.calcsize('>IIIB')
+
+            layout = BoardFactory.create_board(grid_size, task)
+            grid = body[offset:offset + grid_size * grid_size]
+            offset += grid_size * grid_size
+            placed_cells = [
+                [list(layout.cell_coord(index)), value - 1]
+                for index, value in enumerate(grid) if value
+            ]
+
+            figure_count, = struct.unpack_from('>I', body, offset)
+            offset += 4
+            placed_figures = []
+            for _ in range(figure_count):
+                size, = struct.unpack_from(size_format, body, offset)
+                offset += struct.calcsize(size_format)
+                indices = struct.unpack_from(f'>{size}I', body, offset)
+                offset += 4 * size
+                cell_types = body[offset:offset + size]
+                offset += size
+                placed_figures.append([
+                    [list(layout.cell_coord(index)), cell_type]
+                    for index, cell_type in zip(indices, cell_types)
+                ])
+        except (zlib.error, struct.error, IndexError, UnicodeDecodeError):
+            raise ValueError('Файл поврежден')
+
+        return {
+            'grid_size': grid_size,
+            'current_task': task,
+            'variables': {"s": s, "t": t},
+            'placed_figures': placed_figures,
+            'placed_cells': placed_cells,
+            'current_rotation': rotation
+        }
+
+    @staticmethod
+    def save(file_path, data):
+        encoded = BoardStorage.encode_binary(data) if BoardStorage.is_binary_path(file_path) else None
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+
+        try:
+            if encoded is not None:
+                with open(temp_path, 'wb') as f:
+                    f.write(encoded)
+            else:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def load(file_path):
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+
+        if raw.startswith(BoardStorage.BINARY_MAGIC):
+            data = BoardStorage.decode_binary(raw)
+        else:
+            data = json.loads(raw.decode('utf-8'))
+        BoardStorage.check_required_fields(data)
+        return data
+
+    @staticmethod
+    def check_required_fields(data):
+        for field in BoardStorage.REQUIRED_FIELDS:
+            if field not in data:
+                raise ValueError(f'Отсутствует обязательное поле: {field}')
+        BoardStorage.check_board_fields(data)
+
+    @staticmethod
+    def check_board_fields(data):
+        if data['current_task'] not in Board.TASKS:
+            raise ValueError(f'Неизвестный пункт: {data["current_task"]}')
+        if not isinstance(data['grid_size'], int) or data['grid_size'] < Constants.MIN_GRID_SIZE:
+            raise ValueError(f'Некорректный размер поля: {data["grid_size"]}')
+
+    @staticmethod
+    def load_board(file_path, progress=None, is_cancelled=None):
+        with open(file_path, 'rb') as f:
+            if f.read(len(BoardStorage.BINARY_MAGIC)) == BoardStorage.BINARY_MAGIC:
+                f.seek(0)
+                data = BoardStorage.decode_binary(f.read())
+                BoardStorage.check_required_fields(data)
+                return BoardStorage.data_to_board(data), data['current_rotation']
+
+            f.seek(0)
+            total_size = os.fstat(f.fileno()).st_size
+            reader = JsonStreamReader(f)
+            header = {}
+            board = None
+            pending = {'placed_figures': [], 'placed_cells': []}
+            loaded = 0
+
+            for key in reader.iterate_object():
+                if key not in pending:
+                    if key in BoardStorage.REQUIRED_FIELDS:
+                        header[key] = reader.read_value()
+                    else:
+                        reader.skip_value()
+                    continue
+
+                if board is None and all(field in header for field in ['grid_size', 'current_task', 'variables']):
+                    BoardStorage.check_board_fields(header)
+                    board = BoardFactory.create_board(header['grid_size'], header['current_task'], header['variables'])
+
+                for item in reader.iterate_array():
+                    if board is None:
+                        pending[key].append(item)
+                    elif key == 'placed_figures':
+                        board.load_figure(item)
+                    else:
+                        board.load_cell(item[0], item[1])
+
+                    loaded += 1
+                    if loaded % BoardStorage.PROGRESS_STEP == 0:
+                        if progress is not None:
+                            progress(reader.bytes_read, total_size)
+                        if is_cancelled is not None and is_cancelled():
+                            return None
+
+        BoardStorage.check_required_fields(header)
+        if board is None:
+            board = BoardFactory.create_board(header['grid_size'], header['current_task'], header['variables'])
+        for figure in pending['placed_figures']:
+            board.load_figure(figure)
+        for coord, cell_type in pending['placed_cells']:
+            board.load_cell(coord, cell_type)
+        board.finish_load()
+
+        if progress is not None:
+            progress(total_size, total_size)
+        return board, header['current_rotation']
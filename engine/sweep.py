@@ -0,0 +1,128 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine.packing_solver import PackingSolver
+from engine.half_cell_solver import HalfCellSolver
+from engine.polyiamond_solver import PolyiamondSolver
+from engine.polyomino_solver import PolyominoSolver
+
+
+SOLVERS = {task: PackingSolver for task in PackingSolver.SUPPORTED_TASKS}
+SOLVERS.update({task: PolyiamondSolver for task in PolyiamondSolver.SUPPORTED_TASKS})
+SOLVERS.update({task: HalfCellSolver for task in HalfCellSolver.SUPPORTED_TASKS})
+SOLVERS.update({task: PolyominoSolver for task in PolyominoSolver.SUPPORTED_TASKS})
+
+RESULT_FIELDS = ["task", "n", "s", "t", "count", "optimal", "seconds", "error"]
+
+
+def normalize_job(task, n, s, t):
+    if task in ["1a", "4.1a"]:
+        s, t = 1, 1
+    elif task not in ["1b", "4.1b"]:
+        t = 1
+    return (task, n, s, t)
+
+
+def solve_job(job, time_limit=None):
+    task, n, s, t = job
+    started = time.monotonic()
+    result = {"task": task, "n": n, "s": s, "t": t, "count": None, "optimal": False, "error": None}
+    solver = None
+
+    try:
+        solver = SOLVERS[task](n, task, {"s": s, "t": t}, time_limit)
+        result["count"] = len(solver.solve())
+        result["optimal"] = True
+    except TimeoutError:
+        if solver is not None:
+            result["count"] = len(solver.get_figures()) or None
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+class SweepRunner:
+    def __init__(self, jobs, checkpoint_path=None, workers=None, time_limit=None):
+        self.jobs = sorted(set(normalize_job(*job) for job in jobs), key=lambda job: -job[1])
+        self.checkpoint_path = checkpoint_path
+        self.workers = workers or os.cpu_count() or 1
+        self.time_limit = time_limit
+        self.results = {}
+
+        for task, n, s, t in self.jobs:
+            if task not in SOLVERS:
+                raise ValueError(f'Пункт {task} не поддерживается перебором')
+
+        self.load_checkpoint()
+
+    @staticmethod
+    def make_jobs(tasks, sizes, s_values=(1,), t_values=(1,)):
+        return [
+            (task, n, s, t)
+            for task in tasks
+            for n in sizes
+            for s in s_values
+            for t in t_values
+        ]
+
+    def load_checkpoint(self):
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return
+
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                result = json.loads(line)
+                job = (result["task"], result["n"], result["s"], result["t"])
+                self.results[job] = result
+
+    def get_pending_jobs(self):
+        return [job for job in self.jobs if job not in self.results]
+
+    def run(self, progress=None):
+        pending = self.get_pending_jobs()
+        done = len(self.jobs) - len(pending)
+
+        checkpoint = open(self.checkpoint_path, 'a', encoding='utf-8') if self.checkpoint_path else None
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(solve_job, job, self.time_limit): job for job in pending}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        task, n, s, t = job
+                        result = {"task": task, "n": n, "s": s, "t": t, "count": None, "optimal": False,
+                                  "seconds": None, "error": f"{type(e).__name__}: {e}"}
+                    self.results[job] = result
+
+                    if checkpoint is not None:
+                        checkpoint.write(json.dumps(result) + "\n")
+                        checkpoint.flush()
+
+                    done += 1
+                    if progress is not None:
+                        progress(done, len(self.jobs), result)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        return self.get_results()
+
+    def get_results(self):
+        return sorted(self.results.values(), key=lambda result: (result["task"], result["s"], result["t"], result["n"]))
+
+    def write_table(self, path):
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            for result in self.get_results():
+                writer.writerow({field: result.get(field) for field in RESULT_FIELDS})
@@ -0,0 +1,129 @@
+import math
+
+from engine.board import Board
+
+
+class TriangleBoard(Board):
+    LATTICE_TASKS = ["3a", "3b", "4.3a", "4.3b"]
+    EDGE_NEIGHBOURS = {
+        0: [(0, -1), (0, 1), (1, 1)],
+        1: [(0, -1), (0, 1), (-1, -1)]
+    }
+    VERTEX_NEIGHBOURS = {
+        0: [(-1, -2), (-1, -1), (-1, 0), (0, -2), (0, -1), (0, 1),
+            (0, 2), (1, -1), (1, 0), (1, 1), (1, 2), (1, 3)],
+        1: [(-1, -3), (-1, -2), (-1, -1), (-1, 0), (-1, 1), (0, -2),
+            (0, -1), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+    }
+
+    def is_lattice_task(self):
+        return True
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.grid_size and 0 <= col <= 2 * row
+
+    def cell_index(self, row, col):
+        return row * row + col
+
+    def cell_coord(self, index):
+        row = math.isqrt(index)
+        return row, index - row * row
+
+    def get_full_bounds(self):
+        return (0, 0, self.grid_size - 1, 2 * self.grid_size - 2)
+
+    def check_bounds(self, coord):
+        if not self.in_bounds(coord[0], coord[1]):
+            raise ValueError(f'Клетка ({coord[0]}, {coord[1]}) вне треугольника со стороной {self.grid_size}')
+
+    def get_max_common_points(self):
+        if self.current_task in ["3a", "3b"]:
+            return 0
+        elif self.current_task in ["4.3a", "4.3b"]:
+            return 1
+        return None
+
+    def get_figure_shape(self, figure_type=0):
+        s = self.variables["s"]
+        return [(i, m) for i in range(s) for m in range(2 * i + 1)]
+
+    def get_rotated_figure(self, rotation=0, figure_type=0):
+        key = (rotation % 2, figure_type)
+        figure = self.figure_cache.get(key)
+        if figure is None:
+            if rotation % 2 == 0:
+                figure = self.get_figure_shape(figure_type)
+            else:
+                s = self.variables["s"]
+                figure = [(i, 2 * i + m) for i in range(s) for m in range(2 * (s - i) - 1)]
+            self.figure_cache[key] = figure
+        return figure
+
+    def get_figure_cells(self, base_row, base_col, rotation=0, figure_type=0):
+        if self.is_cell_task():
+            return [((base_row, base_col), 0)] if self.in_bounds(base_row, base_col) else []
+
+        if base_col % 2 != rotation % 2:
+            base_col += 1 if base_col == 0 else -1
+
+        cells = []
+        for dr, dc in self.get_rotated_figure(rotation, figure_type):
+            new_row = base_row + dr
+            new_col = base_col + dc
+            if self.in_bounds(new_row, new_col):
+                cells.append(((new_row, new_col), 0))
+        return cells
+
+    def can_place_figure(self, row, col, rotation=0, figure_type=0):
+        cells = self.get_figure_cells(row, col, rotation, figure_type)
+        size = 1 if self.is_cell_task() else len(self.get_rotated_figure(rotation, figure_type))
+        if not cells or len(cells) != size:
+            return False
+
+        occupancy = self.occupancy
+        forbidden_mask = self.forbidden_mask
+        for (new_row, new_col), cell_type in cells:
+            index = new_row * new_row + new_col
+            if occupancy[index] or forbidden_mask[index]:
+                return False
+
+        return True
+
+    def get_connected_neighbours(self, coord, cell_type):
+        row, col = coord
+        for dr, dc in self.EDGE_NEIGHBOURS[col & 1]:
+            neighbour = (row + dr, col + dc)
+            if neighbour in self.cells:
+                yield neighbour
+
+    def get_forbidden_zone_cells(self, figure_cells):
+        if self.current_task in ["3a", "3b"]:
+            return self.get_lattice_zone(figure_cells, self.VERTEX_NEIGHBOURS)
+        elif self.current_task in ["4.3a", "4.3b"]:
+            return self.get_lattice_zone(figure_cells, self.EDGE_NEIGHBOURS)
+        return []
+
+    def get_lattice_zone(self, figure_cells, neighbours):
+        figure_coords = set(coord for coord, cell_type in figure_cells)
+        forbidden_cells = set()
+
+        for row, col in figure_coords:
+            for dr, dc in neighbours[col & 1]:
+                new_row, new_col = row + dr, col + dc
+                if self.in_bounds(new_row, new_col) and (new_row, new_col) not in figure_coords:
+                    forbidden_cells.add(((new_row, new_col), 0))
+
+        return list(forbidden_cells)
+
+    def get_figure_boundary_points(self, figure):
+        boundary_points = set()
+
+        for (row, col), cell_type in figure:
+            top = row * (row + 1) // 2 + col // 2
+            bottom = top + row + 1
+            if col & 1:
+                boundary_points.update((top, top + 1, bottom + 1))
+            else:
+                boundary_points.update((top, bottom, bottom + 1))
+
+        return boundary_points
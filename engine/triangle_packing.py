@@ -0,0 +1,204 @@
+import json
+import os
+from fractions import Fraction
+
+from engine.polyiamond_solver import PolyiamondSolver
+from engine.triangle_board import TriangleBoard
+from utils.constants import Constants
+
+
+class TrianglePacking:
+    TASK = "3a"
+    MAX_PERIOD = 12
+    MIN_CHECKS = 2
+    table_cache = None
+
+    @staticmethod
+    def get_table_path():
+        return os.path.join(Constants.CACHE_DIR, "triangle_packing", f"{TrianglePacking.TASK}.json")
+
+    @staticmethod
+    def load_table():
+        if TrianglePacking.table_cache is not None:
+            return TrianglePacking.table_cache
+
+        try:
+            with open(TrianglePacking.get_table_path(), 'r', encoding='utf-8') as f:
+                table = {int(s): entry for s, entry in json.load(f).items()}
+        except (OSError, ValueError):
+            table = {}
+
+        TrianglePacking.table_cache = table
+        return table
+
+    @staticmethod
+    def save_table(table):
+        path = TrianglePacking.get_table_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({str(s): entry for s, entry in sorted(table.items())}, f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def get_entry(s):
+        return TrianglePacking.load_table().setdefault(s, {"counts": [], "layouts": [], "formula": None})
+
+    @staticmethod
+    def create_board(n, s):
+        return TriangleBoard(n, TrianglePacking.TASK, {"s": s, "t": 1})
+
+    @staticmethod
+    def get_anchors(figures):
+        anchors = []
+        for figure in figures:
+            row, col = min(coord for coord, cell_type in figure)
+            anchors.append([row, col, col & 1])
+        return anchors
+
+    @staticmethod
+    def get_figures(n, s, anchors):
+        board = TrianglePacking.create_board(n, s)
+        return [board.get_figure_cells(row, col, rotation) for row, col, rotation in anchors]
+
+    @staticmethod
+    def create_solver(n, s, time_limit=None):
+        return PolyiamondSolver(n, TrianglePacking.TASK, {"s": s, "t": 1}, time_limit)
+
+    @staticmethod
+    def solve_exact(n, s, time_limit=None):
+        return TrianglePacking.create_solver(n, s, time_limit).solve()
+
+    @staticmethod
+    def build_table(s, max_n, time_limit=None, progress=None):
+        entry = TrianglePacking.get_entry(s)
+
+        for n in range(len(entry["counts"]) + 1, max_n + 1):
+            try:
+                figures = TrianglePacking.solve_exact(n, s, time_limit)
+            except TimeoutError:
+                break
+
+            entry["counts"].append(len(figures))
+            entry["layouts"].append(TrianglePacking.get_anchors(figures))
+            if progress is not None:
+                progress(n, len(figures))
+
+        entry["formula"] = TrianglePacking.fit_formula(entry["counts"])
+        TrianglePacking.save_table(TrianglePacking.load_table())
+        return entry
+
+    @staticmethod
+    def fit_quadratic(points):
+        (x1, y1), (x2, y2), (x3, y3) = [(Fraction(x), Fraction(y)) for x, y in points]
+        a = ((y3 - y1) / (x3 - x1) - (y2 - y1) / (x2 - x1)) / (x3 - x2)
+        b = (y2 - y1) / (x2 - x1) - a * (x1 + x2)
+        c = y1 - a * x1 * x1 - b * x1
+        return a, b, c
+
+    @staticmethod
+    def fit_formula(counts):
+        max_n = len(counts)
+
+        for period in range(1, TrianglePacking.MAX_PERIOD + 1):
+            start = 1
+            coefficients = [None] * period
+
+            for residue in range(period):
+                sizes = [n for n in range(1, max_n + 1) if n % period == residue]
+                if len(sizes) < 3 + TrianglePacking.MIN_CHECKS:
+                    break
+
+                a, b, c = TrianglePacking.fit_quadratic([(n, counts[n - 1]) for n in sizes[-3:]])
+                matched = 0
+                for n in reversed(sizes):
+                    if a * n * n + b * n + c != counts[n - 1]:
+                        break
+                    matched += 1
+
+                if matched < 3 + TrianglePacking.MIN_CHECKS:
+                    break
+
+                start = max(start, sizes[-matched])
+                coefficients[residue] = [[value.numerator, value.denominator] for value in (a, b, c)]
+            else:
+                return {"start": start, "period": period, "verified": max_n, "coefficients": coefficients}
+
+        return None
+
+    @staticmethod
+    def evaluate(formula, n):
+        a, b, c = [Fraction(*value) for value in formula["coefficients"][n % formula["period"]]]
+        return int(a * n * n + b * n + c)
+
+    @staticmethod
+    def get_upper_bound(n, s):
+        return (n + 1) * (n + 2) // 2 // ((s + 1) * (s + 2) // 2)
+
+    @staticmethod
+    def get_count(n, s):
+        entry = TrianglePacking.load_table().get(s)
+        if entry is not None:
+            if n <= len(entry["counts"]):
+                return entry["counts"][n - 1]
+            formula = entry["formula"]
+            if formula is not None and n >= formula["start"]:
+                return TrianglePacking.evaluate(formula, n)
+        return None
+
+    @staticmethod
+    def get_layout(n, s, time_limit=None, on_improve=None, is_cancelled=None):
+        entry = TrianglePacking.load_table().get(s)
+        if entry is not None and n <= len(entry["layouts"]):
+            return TrianglePacking.get_figures(n, s, entry["layouts"][n - 1]), True
+
+        found = []
+        if time_limit is not None:
+            solver = TrianglePacking.create_solver(n, s, time_limit)
+            try:
+                return solver.solve(on_improve, is_cancelled), True
+            except TimeoutError:
+                found = solver.get_figures()
+
+        return max(TrianglePacking.construct(n, s), found, key=len), False
+
+    @staticmethod
+    def construct(n, s):
+        best = []
+        for rotations in [(0, 1), (0,), (1,)]:
+            board = TrianglePacking.create_board(n, s)
+            for row in range(n):
+                for col in range(2 * row + 1):
+                    rotation = col & 1
+                    if rotation in rotations and board.can_place_figure(row, col, rotation):
+                        board.place_figure(row, col, rotation)
+
+            if board.get_figures_count() > len(best):
+                best = board.placed_figures
+        return best
+
+
+class TriangleLayoutSolver:
+    EXACT = False
+    SUPPORTED_TASKS = [TrianglePacking.TASK]
+
+    def __init__(self, grid_size, task, variables, time_limit=None):
+        if task not in self.SUPPORTED_TASKS:
+            raise ValueError(f'Пункт {task} не поддерживается')
+
+        self.grid_size = grid_size
+        self.s = variables["s"]
+        self.time_limit = time_limit
+        self.figures = []
+        self.optimal = False
+
+    def solve(self, on_improve=None, is_cancelled=None):
+        self.figures, self.optimal = TrianglePacking.get_layout(self.grid_size, self.s, self.time_limit,
+                                                              on_improve, is_cancelled)
+        return self.figures
+
+    def get_figures(self):
+        return self.figures
@@ -1,18 +1,23 @@
 import sys
-from PySide6.QtWidgets import QApplication
-from ui.main_window import MainWindow
+from ui.cli import COMMANDS, run_cli
 
 
 def main():
+    if len(sys.argv) > 1 and (sys.argv[1] in COMMANDS or sys.argv[1] in ["-h", "--help"]):
+        sys.exit(run_cli(sys.argv[1:]))
+
+    from PySide6.QtWidgets import QApplication
+    from ui.main_window import MainWindow
+
     app = QApplication(sys.argv)
-    
+
     app.setStyle('Fusion')
-    
+
     window = MainWindow()
     window.show()
-    
+
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
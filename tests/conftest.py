@@ -0,0 +1,55 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.board_factory import BoardFactory
+from engine.triangle_packing import TrianglePacking
+from utils.constants import Constants
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Constants, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(TrianglePacking, "table_cache", None)
+    return tmp_path / "cache"
+
+
+def check_layout(n, task, variables, figures):
+    board = BoardFactory.create_board(n, task, dict(variables))
+    board.load_solution(figures)
+    return board.get_figures_count() == len(figures) and not board.find_conflicts() and \
+        not board.check_figures_touching()
+
+
+def count_brute_force(solver_class, n, task, variables):
+    candidates = list(solver_class(n, task, variables).get_placement_cells())
+    compatible = [
+        {j for j, other in enumerate(candidates) if i != j and check_layout(n, task, variables, [figure, other])}
+        for i, figure in enumerate(candidates)
+    ]
+    best = 0
+
+    def search(remaining, count):
+        nonlocal best
+        best = max(best, count)
+        if count + len(remaining) <= best:
+            return
+        first = remaining[0]
+        search([index for index in remaining[1:] if index in compatible[first]], count + 1)
+        search(remaining[1:], count)
+
+    search(list(range(len(candidates))), 0)
+    return best
+
+
+@pytest.fixture
+def is_valid_layout():
+    return check_layout
+
+
+@pytest.fixture
+def brute_force_count():
+    return count_brute_force
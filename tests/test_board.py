@@ -0,0 +1,136 @@
+import random
+
+import pytest
+
+from engine.board import Board
+from engine.board_factory import BoardFactory
+from engine.half_cell_figures import HalfCellFigures
+from engine.polyiamonds import Polyiamonds
+from engine.polyominoes import Polyominoes
+
+
+TASKS = [
+    ("1a", {"s": 1, "t": 1}),
+    ("1b", {"s": 2, "t": 3}),
+    ("1c", {"s": 3, "t": 1}),
+    ("2a", {"s": 2, "t": 1}),
+    ("3a", {"s": 2, "t": 1}),
+    ("3b", {"s": 3, "t": 1}),
+    ("4.1a", {"s": 1, "t": 1}),
+    ("4.1b", {"s": 1, "t": 2}),
+    ("4.1c", {"s": 2, "t": 1}),
+    ("4.2a", {"s": 1, "t": 1}),
+    ("4.3a", {"s": 2, "t": 1}),
+    ("4.3b", {"s": 2, "t": 1}),
+]
+
+
+def get_figure_set(figures):
+    return sorted(sorted(figure) for figure in figures)
+
+
+def get_touching_set(board):
+    return sorted(get_figure_set([board.figures[figure_id]]) for figure_id in board.check_figures_touching())
+
+
+def rebuild(board):
+    copy = BoardFactory.create_board(board.grid_size, board.current_task, dict(board.variables))
+    placed_figures = [] if board.is_cell_task() else board.placed_figures
+    copy.load_state([[list(cell) for cell in figure] for figure in placed_figures], list(board.placed_cells))
+    return copy
+
+
+def get_positions(board):
+    for row in range(board.grid_size):
+        for col in range(2 * row + 1 if board.is_lattice_task() else board.grid_size):
+            if board.in_bounds(row, col):
+                yield row, col
+
+
+def get_random_click(board, rnd):
+    occupied = [coord for figure in board.placed_figures for coord, cell_type in figure] + \
+               [coord for coord, cell_type in board.placed_cells]
+    if occupied and rnd.random() < 0.7:
+        row, col = rnd.choice(occupied)
+        row, col = row + rnd.randint(-1, 1), col + rnd.randint(-1, 1)
+        if not board.in_bounds(row, col):
+            row, col = rnd.choice(occupied)
+    else:
+        row, col = rnd.choice(list(get_positions(board)))
+
+    rotation = rnd.randrange(2 if board.is_lattice_task() else 4)
+    figure_type = rnd.randrange(5) if board.current_task in ["2a", "4.2a"] else 0
+    return row, col, rotation, figure_type
+
+
+def get_random_shape(board, rnd):
+    s = board.variables["s"]
+    row, col = rnd.choice(list(get_positions(board)))
+    if board.current_task in ["2a", "4.2a"]:
+        shape = rnd.choice(HalfCellFigures.get_fixed(s))
+        return [((r + row, c + col), cell_type) for r, c, cell_type in shape]
+    if board.is_lattice_task():
+        shape = rnd.choice(Polyiamonds.get_fixed(s))
+        return [((r + row, c + col - col % 2), 0) for r, c in shape]
+    shape = rnd.choice(Polyominoes.get_fixed(s))
+    return [((r + row, c + col), 0) for r, c in shape]
+
+
+def assert_same_state(board, copy):
+    assert get_figure_set(board.placed_figures) == get_figure_set(copy.placed_figures)
+    assert dict(board.placed_cells) == dict(copy.placed_cells)
+    assert board.forbidden_counts == copy.forbidden_counts
+    assert board.occupancy == copy.occupancy
+    assert board.forbidden_mask == copy.forbidden_mask
+    assert get_touching_set(board) == get_touching_set(copy)
+
+
+@pytest.mark.parametrize("task, variables", TASKS)
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_board_matches_rebuilt_board(task, variables, seed):
+    rnd = random.Random(seed)
+    board = BoardFactory.create_board(7, task, dict(variables))
+
+    for _ in range(150):
+        if board.is_cell_task() and rnd.random() < 0.3:
+            for (row, col), cell_type in get_random_shape(board, rnd):
+                board.place_figure(row, col, 0, cell_type)
+            assert_same_state(board, rebuild(board))
+            continue
+
+        row, col, rotation, figure_type = get_random_click(board, rnd)
+        if board.is_occupied(row, col):
+            assert board.remove_figure_at(row, col)
+        else:
+            board.place_figure(row, col, rotation, figure_type)
+
+        assert_same_state(board, rebuild(board))
+
+
+@pytest.mark.parametrize("task, variables", [(task, variables) for task, variables in TASKS
+                                             if task not in Board.CELL_TASKS])
+def test_can_place_figure_matches_conflict_check(task, variables):
+    rnd = random.Random(1)
+    rotations = 2 if BoardFactory.is_lattice_task(task) else 4
+    figure_types = 5 if task in ["2a", "4.2a"] else 1
+
+    for _ in range(3):
+        board = BoardFactory.create_board(6, task, dict(variables))
+        size = len(board.get_rotated_figure())
+        candidates = [
+            (row, col, rotation, figure_type)
+            for row, col in get_positions(board)
+            for rotation in range(rotations)
+            for figure_type in range(figure_types)
+        ]
+        rnd.shuffle(candidates)
+
+        for row, col, rotation, figure_type in candidates:
+            cells = board.get_figure_cells(row, col, rotation, figure_type)
+            copy = BoardFactory.create_board(board.grid_size, task, dict(variables))
+            copy.load_state(board.placed_figures + [cells], [])
+            expected = len(cells) == size and not copy.find_conflicts()
+
+            assert board.can_place_figure(row, col, rotation, figure_type) == expected
+            if expected:
+                board.place_figure(row, col, rotation, figure_type)
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from engine.board_factory import BoardFactory
+from engine.storage import BoardStorage
+from ui.cli import run_cli
+
+
+def write_state(path, task, figures, variables=None):
+    data = {
+        'grid_size': 3,
+        'current_task': task,
+        'variables': variables or {"s": 1, "t": 1},
+        'placed_figures': figures,
+        'placed_cells': [],
+        'current_rotation': 0
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+@pytest.mark.parametrize("argv", [
+    ["solve", "--task", "1c", "-n", "0"],
+    ["solve", "--task", "1c", "-n", "3", "-s", "0"],
+    ["solve", "--task", "zz", "-n", "3"],
+    ["sweep", "--tasks", "1a,zz", "-n", "1-3", "-o", "out.csv"],
+    ["sweep", "--tasks", "1a", "-n", "0-3", "-o", "out.csv"],
+    ["table", "-s", "0", "--max-n", "3"],
+])
+def test_rejects_invalid_arguments(argv, cache_dir):
+    with pytest.raises(SystemExit) as error:
+        run_cli(argv)
+    assert error.value.code == 2
+    assert not cache_dir.exists()
+
+
+def test_solve_saves_layout(tmp_path, capsys):
+    output = str(tmp_path / "layout.json")
+    assert run_cli(["solve", "--task", "1a", "-n", "5", "-o", output]) == 0
+    assert capsys.readouterr().out.strip() == "Пункт 1a, n = 5: 4"
+
+    board, rotation = BoardStorage.load_board(output)
+    assert board.get_figures_count() == 4
+
+
+def test_validate_rejects_unknown_task(tmp_path, capsys):
+    path = str(tmp_path / "state.json")
+    write_state(path, "zz", [])
+
+    assert run_cli(["validate", path]) == 2
+    assert "Неизвестный пункт: zz" in capsys.readouterr().err
+
+
+def test_validate_counts_each_figure_once(tmp_path, capsys):
+    board = BoardFactory.create_board(3, "3a", {"s": 1, "t": 1})
+    figures = [board.get_figure_cells(0, 0), board.get_figure_cells(1, 1, 1)]
+    path = str(tmp_path / "state.json")
+    write_state(path, "3a", [[list(cell) for cell in figure] for figure in figures])
+
+    assert run_cli(["validate", path]) == 1
+    assert "Фигур с нарушениями правил: 2" in capsys.readouterr().out
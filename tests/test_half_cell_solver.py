@@ -0,0 +1,20 @@
+import pytest
+
+from engine.half_cell_figures import HalfCellFigures
+from engine.half_cell_solver import HalfCellSolver
+
+
+@pytest.mark.parametrize("s, count", [(1, 9), (2, 71)])
+def test_figure_counts(s, count):
+    shapes = HalfCellFigures.get_fixed(s)
+    assert len(shapes) == count
+    assert all(sum(HalfCellFigures.get_weight(cell_type) for r, c, cell_type in shape) == 2 * s for shape in shapes)
+
+
+@pytest.mark.parametrize("n, s", [(3, 1), (4, 1)])
+def test_solver_matches_brute_force(n, s, is_valid_layout, brute_force_count):
+    variables = {"s": s, "t": 1}
+    figures = HalfCellSolver(n, "2a", variables, 60).solve()
+
+    assert is_valid_layout(n, "2a", variables, figures)
+    assert len(figures) == brute_force_count(HalfCellSolver, n, "2a", variables)
@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from engine.heuristic_solver import HeuristicSolver
+from engine.polyomino_solver import PolyominoSolver
+from engine.sweep import SOLVERS
+
+
+CASES = [
+    ("1a", 4, {"s": 1, "t": 1}),
+    ("1b", 4, {"s": 2, "t": 1}),
+    ("1c", 4, {"s": 2, "t": 1}),
+    ("2a", 3, {"s": 1, "t": 1}),
+    ("3a", 5, {"s": 1, "t": 1}),
+    ("3b", 4, {"s": 2, "t": 1}),
+    ("4.1a", 4, {"s": 1, "t": 1}),
+    ("4.1b", 4, {"s": 1, "t": 2}),
+    ("4.1c", 4, {"s": 2, "t": 1}),
+]
+
+
+@pytest.mark.parametrize("task, n, variables", [
+    ("1c", 4, {"s": 2, "t": 1}),
+    ("1c", 5, {"s": 3, "t": 1}),
+    ("4.1c", 4, {"s": 2, "t": 1}),
+])
+def test_polyomino_solver_matches_brute_force(task, n, variables, is_valid_layout, brute_force_count):
+    figures = PolyominoSolver(n, task, variables, 60).solve()
+
+    assert is_valid_layout(n, task, variables, figures)
+    assert len(figures) == brute_force_count(PolyominoSolver, n, task, variables)
+
+
+@pytest.mark.parametrize("task, n, variables", CASES)
+def test_finds_valid_layout_within_budget(task, n, variables, is_valid_layout):
+    exact = len(SOLVERS[task](n, task, variables).solve())
+    improvements = []
+
+    started = time.monotonic()
+    figures = HeuristicSolver(n, task, variables, 0.3, seed=1).solve(improvements.append)
+
+    assert time.monotonic() - started < 1.0
+    assert is_valid_layout(n, task, variables, figures)
+    assert 0 < len(figures) <= exact
+    assert [len(layout) for layout in improvements] == sorted(set(len(layout) for layout in improvements))
+
+
+def test_stops_when_cancelled(is_valid_layout):
+    started = time.monotonic()
+    figures = HeuristicSolver(40, "2a", {"s": 2, "t": 1}, 60).solve(
+        is_cancelled=lambda: time.monotonic() - started > 0.3
+    )
+
+    assert time.monotonic() - started < 2.0
+    assert is_valid_layout(40, "2a", {"s": 2, "t": 1}, figures)
+
+
+@pytest.mark.parametrize("task, n, variables", [
+    ("1a", 1, {"s": 1, "t": 1}),
+    ("1a", 0, {"s": 1, "t": 1}),
+    ("1b", 3, {"s": 4, "t": 1}),
+    ("2a", 1, {"s": 2, "t": 1}),
+    ("3a", 2, {"s": 3, "t": 1}),
+    ("3b", 2, {"s": 5, "t": 1}),
+])
+def test_returns_empty_layout_when_nothing_fits(task, n, variables):
+    assert HeuristicSolver(n, task, variables, 0.2).solve() == []
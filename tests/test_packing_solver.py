@@ -0,0 +1,41 @@
+import pytest
+
+from engine.packing_solver import PackingSolver
+
+
+@pytest.mark.parametrize("task, n, variables", [
+    ("1a", 4, {"s": 1, "t": 1}),
+    ("1b", 4, {"s": 2, "t": 1}),
+    ("4.1a", 4, {"s": 1, "t": 1}),
+    ("4.1b", 4, {"s": 1, "t": 2}),
+])
+def test_solver_matches_brute_force(task, n, variables, is_valid_layout, brute_force_count):
+    figures = PackingSolver(n, task, variables, 60).solve()
+
+    assert is_valid_layout(n, task, variables, figures)
+    assert len(figures) == brute_force_count(PackingSolver, n, task, variables)
+
+
+def test_solver_keeps_best_layout_on_timeout(is_valid_layout):
+    solver = PackingSolver(30, "1a", {"s": 1, "t": 1}, 0.5)
+    with pytest.raises(TimeoutError):
+        solver.solve()
+
+    figures = solver.get_figures()
+    assert figures
+    assert is_valid_layout(30, "1a", {"s": 1, "t": 1}, figures)
+
+
+def test_solver_stops_when_cancelled():
+    solver = PackingSolver(30, "1a", {"s": 1, "t": 1})
+    with pytest.raises(TimeoutError):
+        solver.solve(is_cancelled=lambda: True)
+
+
+def test_solver_stays_exact_with_small_memo(monkeypatch):
+    expected = len(PackingSolver(7, "1b", {"s": 2, "t": 1}).solve())
+
+    monkeypatch.setattr(PackingSolver, "MEMO_LIMIT", 100)
+    solver = PackingSolver(7, "1b", {"s": 2, "t": 1})
+    assert len(solver.solve()) == expected
+    assert len(solver.memo) <= 100
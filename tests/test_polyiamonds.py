@@ -0,0 +1,25 @@
+import pytest
+
+from engine.polyiamond_solver import PolyiamondSolver
+from engine.polyiamonds import Polyiamonds
+
+
+@pytest.mark.parametrize("size, count", [(1, 1), (2, 1), (3, 1), (4, 3), (5, 4), (6, 12), (7, 24)])
+def test_free_counts(size, count):
+    assert len(Polyiamonds.enumerate_free(size)) == count
+
+
+@pytest.mark.parametrize("size, count", [(1, 2), (2, 3), (3, 6), (4, 14), (5, 36), (6, 94), (7, 250)])
+def test_fixed_counts(size, count):
+    assert len(Polyiamonds.get_fixed(size)) == count
+
+
+@pytest.mark.parametrize("task, n, variables", [
+    ("3b", 4, {"s": 2, "t": 1}),
+    ("4.3b", 4, {"s": 2, "t": 1}),
+])
+def test_solver_matches_brute_force(task, n, variables, is_valid_layout, brute_force_count):
+    figures = PolyiamondSolver(n, task, variables, 60).solve()
+
+    assert is_valid_layout(n, task, variables, figures)
+    assert len(figures) == brute_force_count(PolyiamondSolver, n, task, variables)
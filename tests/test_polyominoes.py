@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+from engine.polyominoes import Polyominoes
+
+
+@pytest.mark.parametrize("size, count", [(1, 1), (2, 1), (3, 2), (4, 5), (5, 12), (6, 35), (7, 108)])
+def test_free_counts(size, count):
+    assert len(Polyominoes.enumerate_free(size)) == count
+
+
+@pytest.mark.parametrize("size, count", [(1, 1), (2, 2), (3, 6), (4, 19), (5, 63), (6, 216)])
+def test_fixed_counts(size, count):
+    shapes = Polyominoes.get_fixed(size)
+    assert len(shapes) == count
+    assert len(set(map(tuple, map(sorted, shapes)))) == count
+
+
+def test_cache_round_trip(monkeypatch):
+    monkeypatch.setattr(Polyominoes, "free_cache", {})
+    shapes = Polyominoes.get_free(4)
+    path = Polyominoes.get_cache_path(4)
+    assert os.path.exists(path)
+    assert not [name for name in os.listdir(os.path.dirname(path)) if name.endswith(".tmp")]
+
+    monkeypatch.setattr(Polyominoes, "free_cache", {})
+    monkeypatch.setattr(Polyominoes, "enumerate_free", lambda size: pytest.fail("cache was not used"))
+    assert Polyominoes.get_free(4) == shapes
@@ -0,0 +1,108 @@
+import os
+import random
+import struct
+import zlib
+
+import pytest
+
+from engine.board_factory import BoardFactory
+from engine.storage import BoardStorage
+
+
+CASES = [
+    ("1a", {"s": 1, "t": 1}),
+    ("1b", {"s": 2, "t": 3}),
+    ("1c", {"s": 3, "t": 1}),
+    ("2a", {"s": 2, "t": 1}),
+    ("3a", {"s": 2, "t": 1}),
+    ("4.3b", {"s": 2, "t": 1}),
+]
+
+
+def create_random_board(task, variables):
+    rnd = random.Random(3)
+    board = BoardFactory.create_board(9, task, dict(variables))
+    for _ in range(300):
+        row = rnd.randrange(board.grid_size)
+        col = rnd.randrange(2 * row + 1) if board.is_lattice_task() else rnd.randrange(board.grid_size)
+        board.place_figure(row, col, rnd.randrange(4), rnd.randrange(5) if task == "2a" else 0)
+    return board
+
+
+def get_state(board):
+    return (
+        sorted(sorted(figure) for figure in board.placed_figures),
+        sorted(board.placed_cells),
+        board.occupancy,
+        board.forbidden_mask,
+        board.forbidden_counts,
+    )
+
+
+@pytest.mark.parametrize("extension", [".json", BoardStorage.BINARY_EXTENSION])
+@pytest.mark.parametrize("task, variables", CASES)
+def test_save_load_round_trip(tmp_path, task, variables, extension):
+    board = create_random_board(task, variables)
+    assert board.get_figures_count() or board.placed_cells
+
+    path = str(tmp_path / f"board{extension}")
+    BoardStorage.save(path, BoardStorage.board_to_data(board, 2))
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+    data = BoardStorage.load(path)
+    assert data['current_rotation'] == 2
+    assert get_state(BoardStorage.data_to_board(data)) == get_state(board)
+
+    loaded, rotation = BoardStorage.load_board(path)
+    assert rotation == 2
+    assert loaded.variables == board.variables
+    assert get_state(loaded) == get_state(board)
+
+
+def test_binary_keeps_large_figures():
+    figure = [[[row, col], 0] for row in range(300) for col in range(300)]
+    data = {
+        'grid_size': 300,
+        'current_task': "1b",
+        'variables': {"s": 300, "t": 300},
+        'placed_figures': [figure],
+        'placed_cells': [],
+        'current_rotation': 0
+    }
+
+    assert BoardStorage.decode_binary(BoardStorage.encode_binary(data))['placed_figures'] == [figure]
+
+
+def test_binary_reads_version_1():
+    figure = [[[0, 0], 0], [[1, 0], 0], [[1, 1], 0]]
+    task = b"1a"
+    body = struct.pack('>B', len(task)) + task + struct.pack('>IIIB', 3, 1, 1, 1) + bytes(9)
+    body += struct.pack('>I', 1) + struct.pack('>H', 3) + struct.pack('>3I', 0, 3, 4) + bytes(3)
+    raw = BoardStorage.BINARY_MAGIC + struct.pack('>B', 1) + zlib.compress(body)
+
+    data = BoardStorage.decode_binary(raw)
+    assert data['placed_figures'] == [figure]
+    assert data['current_rotation'] == 1
+
+
+def test_failed_save_keeps_previous_file(tmp_path):
+    path = str(tmp_path / f"board{BoardStorage.BINARY_EXTENSION}")
+    BoardStorage.save(path, BoardStorage.board_to_data(create_random_board("1a", {"s": 1, "t": 1})))
+    with open(path, 'rb') as f:
+        saved = f.read()
+
+    with pytest.raises(KeyError):
+        BoardStorage.save(path, {'grid_size': 9, 'current_task': "1a", 'current_rotation': 0})
+
+    with open(path, 'rb') as f:
+        assert f.read() == saved
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+
+def test_damaged_binary_file_is_rejected(tmp_path):
+    path = str(tmp_path / f"board{BoardStorage.BINARY_EXTENSION}")
+    with open(path, 'wb') as f:
+        f.write(BoardStorage.BINARY_MAGIC + struct.pack('>B', BoardStorage.BINARY_VERSION) + b"broken")
+
+    with pytest.raises(ValueError):
+        BoardStorage.load(path)
@@ -0,0 +1,36 @@
+from engine import sweep
+from engine.sweep import SOLVERS, SweepRunner, solve_job
+
+
+def test_job_records_result():
+    result = solve_job(("1a", 4, 1, 1))
+    assert result["count"] == len(SOLVERS["1a"](4, "1a", {"s": 1, "t": 1}).solve())
+    assert result["optimal"]
+    assert result["error"] is None
+
+
+def test_job_records_errors(monkeypatch):
+    class BrokenSolver:
+        def __init__(self, *args):
+            raise MemoryError("нет памяти")
+
+    monkeypatch.setitem(sweep.SOLVERS, "1a", BrokenSolver)
+    result = solve_job(("1a", 4, 1, 1))
+    assert result["count"] is None
+    assert not result["optimal"]
+    assert result["error"] == "MemoryError: нет памяти"
+
+
+def test_checkpoint_skips_finished_jobs(tmp_path):
+    checkpoint = str(tmp_path / "sweep.jsonl")
+    jobs = SweepRunner.make_jobs(["1a"], [2, 3])
+    results = SweepRunner(jobs, checkpoint, workers=1).run()
+    assert [result["n"] for result in results] == [2, 3]
+
+    runner = SweepRunner(jobs + [("1a", 4, 1, 1)], checkpoint, workers=1)
+    assert runner.get_pending_jobs() == [("1a", 4, 1, 1)]
+
+    table = str(tmp_path / "sweep.csv")
+    runner.write_table(table)
+    with open(table, 'r', encoding='utf-8') as f:
+        assert f.readline().strip() == ",".join(sweep.RESULT_FIELDS)
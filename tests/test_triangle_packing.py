@@ -0,0 +1,39 @@
+import pytest
+
+from engine.polyiamond_solver import PolyiamondSolver
+from engine.triangle_packing import TriangleLayoutSolver, TrianglePacking
+
+
+@pytest.mark.parametrize("task, n, variables", [
+    ("3a", 5, {"s": 1, "t": 1}),
+    ("4.3a", 4, {"s": 1, "t": 1}),
+])
+def test_solver_matches_brute_force(task, n, variables, is_valid_layout, brute_force_count):
+    figures = PolyiamondSolver(n, task, variables, 60).solve()
+
+    assert is_valid_layout(n, task, variables, figures)
+    assert len(figures) == brute_force_count(PolyiamondSolver, n, task, variables)
+
+
+def test_layout_solver(is_valid_layout, brute_force_count):
+    solver = TriangleLayoutSolver(6, "3a", {"s": 1, "t": 1}, 60)
+    figures = solver.solve()
+    assert solver.optimal
+    assert len(figures) == brute_force_count(PolyiamondSolver, 6, "3a", {"s": 1, "t": 1})
+
+    solver = TriangleLayoutSolver(12, "3a", {"s": 1, "t": 1})
+    figures = solver.solve()
+    assert not solver.optimal
+    assert is_valid_layout(12, "3a", {"s": 1, "t": 1}, figures)
+
+
+def test_table_layouts_are_reused(is_valid_layout):
+    entry = TrianglePacking.build_table(1, 6, 60)
+    assert entry["counts"] == [len(TrianglePacking.solve_exact(n, 1)) for n in range(1, 7)]
+
+    TrianglePacking.table_cache = None
+    for n in range(1, 7):
+        figures, exact = TrianglePacking.get_layout(n, 1)
+        assert exact
+        assert len(figures) == entry["counts"][n - 1]
+        assert is_valid_layout(n, "3a", {"s": 1, "t": 1}, figures)
@@ -0,0 +1,196 @@
+import argparse
+import sys
+
+from engine.raster import BoardRaster
+from engine.storage import BoardStorage
+from engine.sweep import SOLVERS, SweepRunner
+from engine.heuristic_solver import HeuristicSolver
+from engine.triangle_packing import TrianglePacking
+
+
+COMMANDS = ["solve", "validate", "sweep", "convert", "export", "table"]
+
+
+def parse_positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'ожидалось целое число: {value}')
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'число должно быть не меньше 1: {value}')
+    return number
+
+
+def parse_int_list(value):
+    numbers = []
+    for part in value.split(','):
+        if '-' in part:
+            start, end = part.split('-', 1)
+            numbers.extend(range(parse_positive_int(start), parse_positive_int(end) + 1))
+        else:
+            numbers.append(parse_positive_int(part))
+    if not numbers:
+        raise argparse.ArgumentTypeError(f'пустой список: {value}')
+    return numbers
+
+
+def parse_task_list(value):
+    tasks = value.split(',')
+    for task in tasks:
+        if task not in SOLVERS:
+            raise argparse.ArgumentTypeError(f'неизвестный пункт: {task} (доступны: {", ".join(sorted(SOLVERS))})')
+    return tasks
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="main.py", description="Задача №4: расчеты без графического интерфейса")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = subparsers.add_parser("solve", help="найти максимальное размещение")
+    solve_parser.add_argument("--task", required=True, choices=sorted(SOLVERS))
+    solve_parser.add_argument("-n", type=parse_positive_int, required=True, help="размер поля")
+    solve_parser.add_argument("-s", type=parse_positive_int, default=1)
+    solve_parser.add_argument("-t", type=parse_positive_int, default=1)
+    solve_parser.add_argument("--time-limit", type=float, default=None)
+    solve_parser.add_argument("-o", "--output", help="сохранить найденное размещение в файл")
+    solve_parser.add_argument("--heuristic", action="store_true", help="эвристический поиск в пределах --time-limit")
+    solve_parser.add_argument("--seed", type=int, default=None)
+
+    validate_parser = subparsers.add_parser("validate", help="проверить сохраненное состояние")
+    validate_parser.add_argument("file")
+
+    sweep_parser = subparsers.add_parser("sweep", help="перебор по n, s, t на всех ядрах")
+    sweep_parser.add_argument("--tasks", type=parse_task_list, required=True,
+                              help="пункты через запятую, например 1a,4.1a")
+    sweep_parser.add_argument("-n", type=parse_int_list, required=True, help="размеры поля, например 1-30 или 5,10,15")
+    sweep_parser.add_argument("-s", type=parse_int_list, default="1")
+    sweep_parser.add_argument("-t", type=parse_int_list, default="1")
+    sweep_parser.add_argument("--workers", type=parse_positive_int, default=None)
+    sweep_parser.add_argument("--time-limit", type=float, default=None)
+    sweep_parser.add_argument("--checkpoint", default=None)
+    sweep_parser.add_argument("-o", "--output", required=True, help="CSV с результатами")
+
+    convert_parser = subparsers.add_parser("convert", help="пересохранить состояние в другом формате")
+    convert_parser.add_argument("input")
+    convert_parser.add_argument("output")
+
+    export_parser = subparsers.add_parser("export", help="сохранить состояние как PNG")
+    export_parser.add_argument("input")
+    export_parser.add_argument("output")
+    export_parser.add_argument("--tile", type=parse_positive_int, default=8, help="размер клетки в пикселях")
+
+    table_parser = subparsers.add_parser("table", help="таблица и формула для пункта 3a")
+    table_parser.add_argument("-s", type=parse_int_list, default="1", help="стороны треугольников, например 1-4")
+    table_parser.add_argument("--max-n", type=parse_positive_int, required=True, help="до какого n считать точно")
+    table_parser.add_argument("--time-limit", type=float, default=None, help="ограничение на один размер поля")
+    table_parser.add_argument("--query", type=parse_int_list, default=None,
+                              help="размеры поля для ответа по таблице, например 100,1000")
+
+    return parser
+
+
+def run_solve(args):
+    variables = {"s": args.s, "t": args.t}
+    if args.heuristic:
+        solver = HeuristicSolver(args.n, args.task, variables, args.time_limit, args.seed)
+        figures = solver.solve()
+        print(f"Пункт {args.task}, n = {args.n}: не меньше {len(figures)}")
+    else:
+        solver = SOLVERS[args.task](args.n, args.task, variables, args.time_limit)
+        try:
+            figures = solver.solve()
+            print(f"Пункт {args.task}, n = {args.n}: {len(figures)}")
+        except TimeoutError as e:
+            figures = solver.get_figures()
+            if not figures:
+                raise
+            print(f"Пункт {args.task}, n = {args.n}: не меньше {len(figures)} ({e})")
+
+    if args.output:
+        solver.board.load_solution(figures)
+        BoardStorage.save(args.output, BoardStorage.board_to_data(solver.board))
+    return 0
+
+
+def run_validate(args):
+    board, rotation = BoardStorage.load_board(args.file)
+
+    conflicts = board.find_conflicts()
+    touching = board.check_figures_touching()
+
+    print(f"Пункт {board.current_task}, n = {board.grid_size}, фигур: {board.get_figures_count()}")
+    if conflicts or touching:
+        print(f"Фигур с нарушениями правил: {len(set(conflicts) | set(touching))}")
+        return 1
+
+    print("Нарушений нет")
+    return 0
+
+
+def run_sweep(args):
+    jobs = SweepRunner.make_jobs(args.tasks, args.n, args.s, args.t)
+    runner = SweepRunner(jobs, args.checkpoint, args.workers, args.time_limit)
+
+    def progress(done, total, result):
+        outcome = f"ошибка: {result['error']}" if result.get("error") else result["count"]
+        print(f"[{done}/{total}] {result['task']} n={result['n']} s={result['s']} t={result['t']}: "
+              f"{outcome} ({result['seconds']} c)", flush=True)
+
+    runner.run(progress)
+    runner.write_table(args.output)
+    return 0
+
+
+def run_convert(args):
+    board, rotation = BoardStorage.load_board(args.input)
+    BoardStorage.save(args.output, BoardStorage.board_to_data(board, rotation))
+    return 0
+
+
+def run_export(args):
+    board, rotation = BoardStorage.load_board(args.input)
+    BoardRaster.export_png(board, args.output, args.tile)
+    return 0
+
+
+def run_table(args):
+    for s in args.s:
+        def progress(n, count):
+            print(f"s = {s}, n = {n}: {count}", flush=True)
+
+        entry = TrianglePacking.build_table(s, args.max_n, args.time_limit, progress)
+        formula = entry["formula"]
+        if formula is None:
+            print(f"s = {s}: формула не найдена, посчитано до n = {len(entry['counts'])}")
+        else:
+            print(f"s = {s}: формула с периодом {formula['period']} для n >= {formula['start']}, "
+                  f"проверена до n = {formula['verified']}")
+
+        if args.query:
+            for n in args.query:
+                count = TrianglePacking.get_count(n, s)
+                bound = TrianglePacking.get_upper_bound(n, s)
+                if count is None:
+                    count = len(TrianglePacking.construct(n, s))
+                    print(f"s = {s}, n = {n}: от {count} до {bound}")
+                else:
+                    print(f"s = {s}, n = {n}: {count}")
+    return 0
+
+
+def run_cli(argv):
+    args = build_parser().parse_args(argv)
+    handlers = {
+        "solve": run_solve,
+        "validate": run_validate,
+        "sweep": run_sweep,
+        "convert": run_convert,
+        "export": run_export,
+        "table": run_table
+    }
+
+    try:
+        return handlers[args.command](args)
+    except (OSError, ValueError, TimeoutError) as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 2
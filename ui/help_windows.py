@@ -35,10 +35,14 @@ class HelpWindow:
             <li>Для удаления фигуры тыкни на нее <b>ЛКМ</b>.</li>
             <li>Для поворота фигуры нажми <b>R</b> <strong>или прокрути колесико мыши</strong>.</li>
             <li>Для выбора типа фигуры (в пунктах 2a и 4.2a) прокрути <strong>колесико мыши</strong> или нажми <strong>R</strong>.</li>
+            <li>Для изменения масштаба поля прокрути <strong>колесико мыши</strong> с зажатым <b>Ctrl</b> или нажми <b>+</b> / <b>-</b>.</li>
+            <li>Для перемещения по полю зажми <b>ПКМ</b> и веди мышку или нажимай стрелки. <b>Home</b> возвращает исходный масштаб.</li>
             <li>Фигуры отображаются <span style="color: blue;">синим цветом</span>.</li>
             <li>Область, в которой нельзя ставить фигуры (по условию) отображается <span style="color: red;">красным цветом</span>.</li>
             <li>Макет фигуры, которую ты собираешься тсавить, тоже отображается <span style="color: red;">красным цветом</span>.</li>
-            <li>В пункте <strong>4.2a</strong> фигуры, имеющие более одной общей точки, подсвечиваются <span style="color: yellow;">желтым цветом</span>.</li>
+            <li>В пунктах <strong>4.2a</strong>, <strong>4.3a</strong> и <strong>4.3b</strong> фигуры, имеющие более одной общей точки, подсвечиваются <span style="color: yellow;">желтым цветом</span>.</li>
+            <li>В пункте <strong>3a</strong> клавиша <b>R</b> переворачивает треугольник вершиной вверх или вниз.</li>
+            <li>Меню <b>Решение → Эвристический поиск</b> улучшает размещение в фоне в течение времени, заданного в настройках; лучшее найденное размещение сразу появляется на поле.</li>
         </ul>
         """
 
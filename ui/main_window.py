@@ -1,12 +1,16 @@
-import sys
-import json
 from PySide6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, 
-                               QMenuBar, QMenu, QFileDialog, QMessageBox)
-from PySide6.QtCore import Qt
+                               QMenuBar, QMenu, QFileDialog, QMessageBox, QProgressDialog)
+from PySide6.QtCore import Qt, QThreadPool
 from widgets.grid_widget import GridWidget
 from widgets.settings_panel import SettingsPanel
 from utils.constants import Constants
 from ui.help_windows import HelpDialog, HelpWindow
+from engine.sweep import SOLVERS
+from engine.heuristic_solver import HeuristicSolver
+from engine.triangle_packing import TrianglePacking, TriangleLayoutSolver
+from engine.storage import BoardStorage
+from ui.storage_worker import SaveTask, LoadTask
+from ui.solver_worker import SolverTask
 
 
 class MainWindow(QMainWindow):
@@ -14,6 +18,11 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle(Constants.APP_NAME)
         self.setGeometry(100, 100, Constants.DEFAULT_WINDOW_WIDTH, Constants.DEFAULT_WINDOW_HEIGHT)
+        self.storage_task = None
+        self.solver_task = None
+        self.progress_dialog = None
+        self.exit_after_save = False
+        self.close_after_save = False
         
         self.setup_ui()
         self.connect_signals()
@@ -27,6 +36,12 @@ class MainWindow(QMainWindow):
         load_action = file_menu.addAction('Загрузить...')
         load_action.triggered.connect(self.load_file)
         
+        solve_menu = menubar.addMenu('Решение')
+        solve_action = solve_menu.addAction('Найти максимальное размещение')
+        solve_action.triggered.connect(self.solve_task)
+        heuristic_action = solve_menu.addAction('Эвристический поиск')
+        heuristic_action.triggered.connect(self.solve_heuristic)
+        
         help_menu = menubar.addMenu('Помощь')
         help_action = help_menu.addAction('Помощь')
         help_action.triggered.connect(self.show_help)
@@ -75,6 +90,95 @@ class MainWindow(QMainWindow):
 
         self.settings_panel.update_input_visibility()
     
+    def solve_task(self):
+        if self.solver_task is not None or self.storage_task is not None:
+            return
+        
+        task = self.grid_widget.current_task
+        if task == TrianglePacking.TASK:
+            solver_class = TriangleLayoutSolver
+        elif task in SOLVERS:
+            solver_class = SOLVERS[task]
+        else:
+            QMessageBox.information(self, 'Решение', f'Для пункта {task} точный решатель пока недоступен')
+            return
+        
+        self.start_solver_task(solver_class, self.grid_widget.grid_size, task, dict(self.grid_widget.variables),
+                               Constants.SOLVER_TIME_LIMIT)
+    
+    def get_triangle_packing_message(self, figures):
+        n = self.grid_widget.grid_size
+        s = self.grid_widget.variables["s"]
+        count = TrianglePacking.get_count(n, s)
+        if count is None:
+            bound = TrianglePacking.get_upper_bound(n, s)
+            return f'Построено фигур: {len(figures)}, максимум не больше {bound}'
+        return f'Построено фигур: {len(figures)}, максимальное количество по формуле: {count}'
+    
+    def solve_heuristic(self):
+        if self.solver_task is not None or self.storage_task is not None:
+            return
+        
+        task = self.grid_widget.current_task
+        if task not in HeuristicSolver.SUPPORTED_TASKS:
+            QMessageBox.information(self, 'Решение', f'Для пункта {task} эвристический поиск пока недоступен')
+            return
+        
+        self.start_solver_task(HeuristicSolver, self.grid_widget.grid_size, task, dict(self.grid_widget.variables),
+                               self.settings_panel.get_time_budget())
+    
+    def start_solver_task(self, solver_class, *args):
+        self.solver_task = SolverTask(solver_class, *args)
+        self.solver_task.signals.improved.connect(self.on_solver_improved)
+        self.solver_task.signals.finished.connect(self.on_solver_finished)
+        self.solver_task.signals.failed.connect(self.on_solver_failed)
+        
+        self.progress_dialog = QProgressDialog('Поиск решения...', 'Остановить', 0, 0, self)
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_dialog.canceled.connect(self.solver_task.cancel)
+        QThreadPool.globalInstance().start(self.solver_task)
+    
+    def stop_solver_task(self):
+        if self.solver_task is None:
+            return
+        
+        self.solver_task.signals.blockSignals(True)
+        self.solver_task.cancel()
+        self.finish_solver_task()
+    
+    def finish_solver_task(self):
+        if self.progress_dialog is not None:
+            self.progress_dialog.close()
+            self.progress_dialog = None
+        self.solver_task = None
+    
+    def on_solver_improved(self, figures):
+        self.grid_widget.set_figures(figures)
+        if self.progress_dialog is not None:
+            self.progress_dialog.setLabelText(f'Поиск решения...\nНайдено фигур: {len(figures)}')
+    
+    def on_solver_finished(self, result):
+        self.finish_solver_task()
+        
+        figures, optimal = result
+        if not figures and not optimal:
+            QMessageBox.warning(self, 'Решение', 'За отведенное время размещение не найдено')
+            return
+        
+        self.grid_widget.set_figures(figures)
+        if optimal:
+            QMessageBox.information(self, 'Решение', f'Максимальное количество фигур: {len(figures)}')
+        elif self.grid_widget.current_task == TrianglePacking.TASK:
+            QMessageBox.information(self, 'Решение', self.get_triangle_packing_message(figures))
+        else:
+            QMessageBox.information(self, 'Решение', 
+                                    f'Лучшее найденное размещение: {len(figures)} (максимальность не доказана)')
+    
+    def on_solver_failed(self, message):
+        self.finish_solver_task()
+        QMessageBox.critical(self, 'Ошибка', f'Не удалось найти решение: {message}')
+    
     def on_task_changed(self):
         self.settings_panel.update_input_visibility()
     
@@ -82,7 +186,8 @@ class MainWindow(QMainWindow):
         return len(self.grid_widget.placed_figures) > 0 or len(self.grid_widget.placed_cells) > 0
     
     def closeEvent(self, event):
-        if not self.has_figures():
+        if self.close_after_save or not self.has_figures():
+            self.stop_solver_task()
             event.accept()
             return
         
@@ -104,112 +209,114 @@ class MainWindow(QMainWindow):
         if clicked_button == cancel_button:
             event.ignore()
         elif clicked_button == exit_button:
+            self.stop_solver_task()
             event.accept()
         elif clicked_button == save_exit_button:
-            if self.save_file(exit_after_save=True):
-                event.accept()
-            else:
-                event.ignore()
+            self.save_file(exit_after_save=True)
+            event.ignore()
     
     def save_file(self, exit_after_save=False):
-        try:
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, 
-                'Сохранить состояние', 
-                '', 
-                'JSON Files (*.json);;All Files (*)'
-            )
-            
-            if not file_path:
-                return False
-            
-            if not file_path.endswith('.json'):
-                file_path += '.json'
-            
-            data = {
-                'grid_size': self.grid_widget.grid_size,
-                'current_task': self.grid_widget.current_task,
-                'variables': self.grid_widget.variables,
-                'placed_figures': [
-                    [[list(coord), cell_type] for coord, cell_type in figure] 
-                    for figure in self.grid_widget.placed_figures
-                ],
-                'placed_cells': [
-                    [list(coord), cell_type] for coord, cell_type in self.grid_widget.placed_cells
-                ],
-                'forbidden_zones': [
-                    [list(coord), cell_type] for coord, cell_type in self.grid_widget.forbidden_zones
-                ],
-                'current_rotation': self.grid_widget.current_rotation
-            }
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            if not exit_after_save:
-                QMessageBox.information(self, 'Успех', 'Файл успешно сохранен!')
-            
-            return True
-            
-        except Exception as e:
-            QMessageBox.critical(self, 'Ошибка', f'Не удалось сохранить файл: {str(e)}')
+        if self.storage_task is not None:
             return False
+        
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, 
+            'Сохранить состояние', 
+            '', 
+            'JSON Files (*.json);;Binary Files (*.t4b);;All Files (*)'
+        )
+        
+        if not file_path:
+            return False
+        
+        if not file_path.endswith('.json') and not BoardStorage.is_binary_path(file_path):
+            if selected_filter.startswith('Binary'):
+                file_path += BoardStorage.BINARY_EXTENSION
+            else:
+                file_path += '.json'
+        
+        data = BoardStorage.board_to_data(self.grid_widget.board, self.grid_widget.current_rotation)
+        
+        self.exit_after_save = exit_after_save
+        self.storage_task = SaveTask(file_path, data)
+        self.storage_task.signals.finished.connect(self.on_save_finished)
+        self.storage_task.signals.failed.connect(self.on_save_failed)
+        self.show_progress('Сохранение файла...', False)
+        QThreadPool.globalInstance().start(self.storage_task)
+        return True
 
     def load_file(self):
-        try:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self, 
-                'Загрузить состояние', 
-                '', 
-                'JSON Files (*.json);;All Files (*)'
-            )
-            
-            if file_path:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                required_fields = ['grid_size', 'current_task', 'variables', 
-                                'placed_figures', 'forbidden_zones', 'current_rotation']
-                
-                for field in required_fields:
-                    if field not in data:
-                        raise ValueError(f'Отсутствует обязательное поле: {field}')
-                
-                self.grid_widget.grid_size = data['grid_size']
-                self.grid_widget.current_task = data['current_task']
-                self.grid_widget.variables = data['variables']
-                
-                self.grid_widget.placed_figures = [
-                    [((coord[0], coord[1]), cell_type) for coord, cell_type in figure] 
-                    for figure in data['placed_figures']
-                ]
-                
-                self.grid_widget.forbidden_zones = [
-                    ((coord[0], coord[1]), cell_type) for coord, cell_type in data['forbidden_zones']
-                ]
-                
-                self.grid_widget.current_rotation = data['current_rotation']
-                
-                if 'placed_cells' in data:
-                    self.grid_widget.placed_cells = set(
-                        ((coord[0], coord[1]), cell_type) for coord, cell_type in data['placed_cells']
-                    )
-                else:
-                    self.grid_widget.placed_cells = set()
-                
-                self.settings_panel.task_combo.setCurrentText(data['current_task'])
-                self.settings_panel.grid_size_input.setValue(data['grid_size'])
-                
-                self.grid_widget.update_current_figure()
-                self.grid_widget.update_figures_count()
-                self.grid_widget.update()
-                
-                self.settings_panel.current_task = data['current_task']
-                self.settings_panel.current_grid_size = data['grid_size']
-                self.settings_panel.current_variables = data['variables']
-                self.settings_panel.update_parameters_display()
-                
-                QMessageBox.information(self, 'Успех', 'Файл успешно загружен!')
-                
-        except Exception as e:
-            QMessageBox.critical(self, 'Ошибка', f'Не удалось загрузить файл: {str(e)}')
\ No newline at end of file
+        if self.storage_task is not None:
+            return
+        
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, 
+            'Загрузить состояние', 
+            '', 
+            'Saved States (*.json *.t4b);;JSON Files (*.json);;Binary Files (*.t4b);;All Files (*)'
+        )
+        
+        if not file_path:
+            return
+        
+        self.storage_task = LoadTask(file_path)
+        self.storage_task.signals.progress.connect(self.on_storage_progress)
+        self.storage_task.signals.finished.connect(self.on_load_finished)
+        self.storage_task.signals.failed.connect(self.on_load_failed)
+        self.show_progress('Загрузка файла...', True)
+        self.progress_dialog.canceled.connect(self.storage_task.cancel)
+        QThreadPool.globalInstance().start(self.storage_task)
+    
+    def show_progress(self, text, cancellable):
+        self.progress_dialog = QProgressDialog(text, 'Отмена', 0, 100 if cancellable else 0, self)
+        if not cancellable:
+            self.progress_dialog.setCancelButton(None)
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(500)
+        self.progress_dialog.setValue(0)
+    
+    def finish_storage_task(self):
+        if self.progress_dialog is not None:
+            self.progress_dialog.close()
+            self.progress_dialog = None
+        self.storage_task = None
+    
+    def on_storage_progress(self, value):
+        if self.progress_dialog is not None:
+            self.progress_dialog.setValue(value)
+    
+    def on_save_finished(self, file_path):
+        self.finish_storage_task()
+        
+        if self.exit_after_save:
+            self.close_after_save = True
+            self.close()
+        else:
+            QMessageBox.information(self, 'Успех', 'Файл успешно сохранен!')
+    
+    def on_save_failed(self, message):
+        self.finish_storage_task()
+        QMessageBox.critical(self, 'Ошибка', f'Не удалось сохранить файл: {message}')
+    
+    def on_load_finished(self, result):
+        self.finish_storage_task()
+        
+        if result is None:
+            return
+        
+        board, rotation = result
+        self.grid_widget.set_board(board, rotation)
+        
+        self.settings_panel.task_combo.setCurrentText(board.current_task)
+        self.settings_panel.grid_size_input.setValue(board.grid_size)
+        
+        self.settings_panel.current_task = board.current_task
+        self.settings_panel.current_grid_size = board.grid_size
+        self.settings_panel.current_variables = board.variables
+        self.settings_panel.update_parameters_display()
+        
+        QMessageBox.information(self, 'Успех', 'Файл успешно загружен!')
+    
+    def on_load_failed(self, message):
+        self.finish_storage_task()
+        QMessageBox.critical(self, 'Ошибка', f'Не удалось загрузить файл: {message}')
\ No newline at end of file
@@ -0,0 +1,40 @@
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class SolverSignals(QObject):
+    improved = Signal(object)
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class SolverTask(QRunnable):
+    def __init__(self, solver_class, *args):
+        super().__init__()
+        self.solver_class = solver_class
+        self.args = args
+        self.solver = None
+        self.cancelled = False
+        self.signals = SolverSignals()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def is_cancelled(self):
+        return self.cancelled
+
+    def report_improvement(self, figures):
+        self.signals.improved.emit(figures)
+
+    def run(self):
+        try:
+            self.solver = self.solver_class(*self.args)
+            figures = self.solver.solve(self.report_improvement, self.is_cancelled)
+            optimal = self.solver.optimal
+        except TimeoutError:
+            figures = self.solver.get_figures() if self.solver is not None else []
+            optimal = False
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit((figures, optimal))
@@ -0,0 +1,52 @@
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from engine.storage import BoardStorage
+
+
+class StorageSignals(QObject):
+    progress = Signal(int)
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class SaveTask(QRunnable):
+    def __init__(self, file_path, data):
+        super().__init__()
+        self.file_path = file_path
+        self.data = data
+        self.signals = StorageSignals()
+
+    def run(self):
+        try:
+            BoardStorage.save(self.file_path, self.data)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(self.file_path)
+
+
+class LoadTask(QRunnable):
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.cancelled = False
+        self.signals = StorageSignals()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def is_cancelled(self):
+        return self.cancelled
+
+    def report_progress(self, done, total):
+        self.signals.progress.emit(int(done * 100 / total) if total else 100)
+
+    def run(self):
+        try:
+            result = BoardStorage.load_board(self.file_path, self.report_progress, self.is_cancelled)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(result)
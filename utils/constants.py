@@ -1,3 +1,6 @@
+import os
+
+
 class Constants:
     APP_NAME = "Задача №4 симуляция"
     DEFAULT_WINDOW_WIDTH = 1400
@@ -6,4 +9,11 @@ class Constants:
     GRID_MIN_SIZE = 400
     DEFAULT_GRID_SIZE = 10
     MIN_GRID_SIZE = 1
-    MAX_GRID_SIZE = 999
\ No newline at end of file
+    MAX_GRID_SIZE = 999
+    MAX_CELL_SIZE = 80
+    DETAIL_CELL_SIZE = 4
+    ZOOM_STEP = 1.25
+    SOLVER_TIME_LIMIT = 60
+    HEURISTIC_TIME_LIMIT = 10
+    MAX_HEURISTIC_TIME_LIMIT = 3600
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
\ No newline at end of file
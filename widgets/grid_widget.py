@@ -1,30 +1,79 @@
+import math
 from PySide6.QtWidgets import QWidget, QLabel
-from PySide6.QtGui import QPainter, QPen, QMouseEvent, QBrush, QColor, QPolygonF
-from PySide6.QtCore import Qt, QPoint, Signal, QPointF
+from PySide6.QtGui import QPainter, QPen, QMouseEvent, QBrush, QColor, QPolygonF, QPixmap, QImage, QPainterPath
+from PySide6.QtCore import Qt, QPoint, Signal, QPointF, QRect, QRectF
 from utils.constants import Constants
-from utils.figure_manager import FigureManager
+from engine.board import Board
+from engine.board_factory import BoardFactory
+from engine.raster import BoardRaster
 
 
 class GridWidget(QWidget):
     figures_count_changed = Signal(int)
     
+    TRIANGLE_POINTS = {
+        0: [(0, 0), (1, 0), (1, 1), (0, 1)],
+        1: [(0, 0), (1, 0), (0, 1)],
+        2: [(0, 0), (1, 0), (1, 1)],
+        3: [(0, 0), (0, 1), (1, 1)],
+        4: [(1, 0), (0, 1), (1, 1)],
+        5: [(0, 0), (1, 0), (0.5, 0.5)],
+        6: [(1, 0), (1, 1), (0.5, 0.5)],
+        7: [(0, 1), (1, 1), (0.5, 0.5)],
+        8: [(0, 0), (0, 1), (0.5, 0.5)]
+    }
+    LATTICE_POINTS = {
+        0: [(0, 0), (-0.5, 1), (0.5, 1)],
+        1: [(0, 0), (1, 0), (0.5, 1)]
+    }
+    
     def __init__(self, grid_size=Constants.DEFAULT_GRID_SIZE):
         super().__init__()
-        self.grid_size = grid_size
-        self.current_task = "1a"
-        self.variables = {"s": 1, "t": 1}
+        self.board = Board(grid_size)
         self.setMinimumSize(Constants.GRID_MIN_SIZE, Constants.GRID_MIN_SIZE)
         self.hover_cell = None
         self.coords_label = None
-        self.placed_figures = []
-        self.forbidden_zones = []
-        self.placed_cells = set()
-        self.current_figure = self.get_figure_shape()
         self.current_rotation = 0
         self.current_figure_type = 0
+        self.current_figure = self.board.get_rotated_figure()
+        self.board_layer = None
+        self.board_layer_key = None
+        self.board_layer_version = None
+        self.board_image = None
+        self.board_image_key = None
+        self.triangle_paths = {}
+        self.triangle_paths_size = None
+        self.zoom = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.pan_start = None
         self.setup_coords_label()
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
+    
+    @property
+    def grid_size(self):
+        return self.board.grid_size
+    
+    @property
+    def current_task(self):
+        return self.board.current_task
+    
+    @property
+    def variables(self):
+        return self.board.variables
+    
+    @property
+    def placed_figures(self):
+        return self.board.placed_figures
+    
+    @property
+    def placed_cells(self):
+        return self.board.placed_cells
+    
+    @property
+    def forbidden_zones(self):
+        return self.board.forbidden_zones
         
     def setup_coords_label(self):
         self.coords_label = QLabel(self)
@@ -40,23 +89,19 @@ class GridWidget(QWidget):
         self.coords_label.hide()
         
     def set_grid_size(self, size):
-        self.grid_size = size
+        self.board.set_grid_size(size)
         self.hover_cell = None
         self.coords_label.hide()
-        self.placed_figures = []
-        self.forbidden_zones = []
-        self.placed_cells = set()
         self.current_rotation = 0
         self.current_figure_type = 0
         self.update_current_figure()
         self.update_figures_count()
-        self.update()
+        self.reset_view()
         
     def set_task(self, task):
-        self.current_task = task
-        self.placed_figures = []
-        self.forbidden_zones = []
-        self.placed_cells = set()
+        self.board = BoardFactory.create_board(self.grid_size, task, self.variables)
+        self.board_layer = None
+        self.board_image = None
         self.current_rotation = 0
         self.current_figure_type = 0
         self.update_current_figure()
@@ -64,960 +109,571 @@ class GridWidget(QWidget):
         self.update()
         
     def set_variables(self, variables):
-        self.variables = variables
+        self.board.set_variables(variables)
         self.update_current_figure()
         self.update()
     
-    def get_figure_shape(self):
-        if self.current_task in ["1a", "4.1a"]:
-            return FigureManager.get_figure_shapes()["corner"]
-        elif self.current_task in ["1b", "4.1b"]:
-            s, t = self.variables["s"], self.variables["t"]
-            rectangle = []
-            for i in range(s):
-                for j in range(t):
-                    rectangle.append((i, j))
-            return rectangle
-        elif self.current_task in ["2a", "4.2a"]:
-            return FigureManager.get_triangle_shape_by_type(self.current_figure_type)
-        return FigureManager.get_figure_shapes()["corner"]
-    
     def update_current_figure(self):
-        base_figure = self.get_figure_shape()
-        self.current_figure = FigureManager.rotate_figure(base_figure, self.current_rotation)
+        self.current_figure = self.board.get_rotated_figure(self.current_rotation, self.current_figure_type)
     
-    def rotate_figure(self):
-        self.current_rotation = (self.current_rotation + 1) % 4
+    def rotate_figure(self, delta=1):
+        old_rect = self.get_hover_rect()
+        self.current_rotation = (self.current_rotation + delta) % 4
         self.update_current_figure()
-        self.update()
+        self.update(old_rect.united(self.get_hover_rect()))
     
     def change_figure_type(self, delta):
         if self.current_task in ["2a", "4.2a"]:
+            old_rect = self.get_hover_rect()
             self.current_figure_type = (self.current_figure_type + delta) % 5
             self.update_current_figure()
-            self.update()
+            self.update(old_rect.united(self.get_hover_rect()))
     
     def get_figure_cells(self, base_row, base_col):
-        cells = []
-        
-        if self.current_task in ["2a", "4.2a"]:
-            if 0 <= base_row < self.grid_size and 0 <= base_col < self.grid_size:
-                cells.append(((base_row, base_col), self.current_figure_type))
-        else:
-            for dr, dc in self.current_figure:
-                new_row = base_row + dr
-                new_col = base_col + dc
-                if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                    cell_type = 0
-                    cells.append(((new_row, new_col), cell_type))
-        
-        return cells
+        return self.board.get_figure_cells(base_row, base_col, self.current_rotation, self.current_figure_type)
     
-    def get_cell_weight(self, cell_type):
-        if cell_type == 0:
-            return 1
-        else:
-            return 0.5
+    def can_place_figure(self, row, col):
+        return self.board.can_place_figure(row, col, self.current_rotation, self.current_figure_type)
     
-    def get_component_weight(self, component):
-        total_weight = 0
-        for coord, cell_type in component:
-            total_weight += self.get_cell_weight(cell_type)
-        return total_weight
+    def place_figure(self, row, col):
+        if self.board.place_figure(row, col, self.current_rotation, self.current_figure_type):
+            self.update_figures_count()
+            self.update(self.get_changed_rect().united(self.get_hover_rect()))
+            return True
+        return False
     
-    def are_cells_connected(self, cell1, cell2):
-        (row1, col1), type1 = cell1
-        (row2, col2), type2 = cell2
-        
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        is_neighbor = False
-        for dr, dc in directions:
-            if row1 + dr == row2 and col1 + dc == col2:
-                is_neighbor = True
-                break
-        
-        if not is_neighbor:
-            return False
-        
-        if self.current_task in ["1c", "4.1c"]:
+    def remove_figure_at(self, row, col):
+        if self.board.remove_figure_at(row, col):
+            self.update_figures_count()
+            self.update(self.get_changed_rect().united(self.get_hover_rect()))
             return True
-            
-        elif self.current_task == "2a":
-            return self.are_cells_connected_2a(cell1, cell2)
-            
-        elif self.current_task == "4.2a":
-            return self.are_cells_connected_2a(cell1, cell2)
-        
-        return True
+        return False
     
-    def are_cells_connected_2a(self, cell1, cell2):
-        (row1, col1), type1 = cell1
-        (row2, col2), type2 = cell2
-        if type1 != 0 and type2 == 0:
-            (row1, col1), type1 = cell2
-            (row2, col2), type2 = cell1
+    def get_cell_size(self):
+        if self.board.is_lattice_task():
+            side = min(self.width(), self.height() * 2 / math.sqrt(3)) / self.grid_size * self.zoom
+            return side, side * math.sqrt(3) / 2
         
-        if type1 == 0 and type2 == 0:
-            return True
-            
-        if type1 > 0 and type2 > 0 and type1 == type2:
-            return False
+        return (self.width() / self.grid_size * self.zoom, 
+                self.height() / self.grid_size * self.zoom)
+    
+    def get_lattice_center(self):
+        return self.width() * self.zoom / 2 - self.offset_x
+    
+    def get_cell_at(self, x, y):
+        cell_width, cell_height = self.get_cell_size()
+        
+        if self.board.is_lattice_task():
+            position_y = (y + self.offset_y) / cell_height
+            position_x = (x - self.get_lattice_center()) / cell_width + position_y / 2
+            row = math.floor(position_y)
+            column = math.floor(position_x)
+            return row, 2 * column + (1 if position_x - column > position_y - row else 0)
+        
+        return (math.floor((y + self.offset_y) / cell_height), 
+                math.floor((x + self.offset_x) / cell_width))
+    
+    def get_visible_bounds(self, rect):
+        if self.board.is_lattice_task():
+            cell_width, cell_height = self.get_cell_size()
+            min_row = max(math.floor((rect.top() + self.offset_y) / cell_height), 0)
+            max_row = min(math.floor((rect.bottom() + self.offset_y) / cell_height), self.grid_size - 1)
+            return min_row, 0, max_row, 2 * max_row
+        
+        min_row, min_col = self.get_cell_at(rect.left(), rect.top())
+        max_row, max_col = self.get_cell_at(rect.right(), rect.bottom())
+        return (max(min_row, 0), max(min_col, 0), 
+                min(max_row, self.grid_size - 1), min(max_col, self.grid_size - 1))
+    
+    def get_lattice_columns(self, row, left, right):
+        cell_width = self.get_cell_size()[0]
+        center = self.get_lattice_center()
+        first = math.floor((left - center) / cell_width + row / 2 - 1)
+        last = math.ceil((right - center) / cell_width + row / 2 + 0.5)
+        return max(2 * first, 0), min(2 * last + 1, 2 * row)
+    
+    def get_cells_rect(self, min_row, min_col, max_row, max_col):
+        cell_width, cell_height = self.get_cell_size()
         
-        if type1 == 0:
-            if row1 - row2 == 1:
-                return type2 in [3, 4]
-            if row1 - row2 == -1:
-                return type2 in [1, 2]
-            if col1 - col2 == 1:
-                return type2 in [2, 4]
-            if col1 - col2 == -1:
-                return type2 in [1, 3]
+        if self.board.is_lattice_task():
+            center = self.get_lattice_center()
+            left = math.floor(center + (min_col // 2 - (max_row + 1) / 2) * cell_width) - 2
+            right = math.ceil(center + (max_col // 2 + 1 - min_row / 2) * cell_width) + 2
+        else:
+            left = math.floor(min_col * cell_width - self.offset_x) - 2
+            right = math.ceil((max_col + 1) * cell_width - self.offset_x) + 2
+        top = math.floor(min_row * cell_height - self.offset_y) - 2
+        bottom = math.ceil((max_row + 1) * cell_height - self.offset_y) + 2
         
-        if type1 == 1:
-            if type2 == 2:
-                return col1 - col2 == 1
-            elif type2 == 3:
-                return row1 - row2 == 1
-            elif type2 == 4:
-                return col1 - col2 == 1 or row1 - row2 == 1
-        elif type1 == 2:
-            if type2 == 1:
-                return col1 - col2 == -1
-            elif type2 == 4:
-                return row1 - row2 == 1
-            elif type2 == 3:
-                return col1 - col2 == -1 or row1 - row2 == 1
-        elif type1 == 3:
-            if type2 == 4:
-                return col1 - col2 == 1
-            elif type2 == 1:
-                return row1 - row2 == -1
-            elif type2 == 2:
-                return col1 - col2 == 1 or row1 - row2 == -1
-        elif type1 == 4:
-            if type2 == 3:
-                return col1 - col2 == -1
-            elif type2 == 2:
-                return row1 - row2 == -1
-            elif type2 == 1:
-                return col1 - col2 == -1 or row1 - row2 == -1
-
-        return False
+        return QRect(left, top, right - left, bottom - top).intersected(self.rect())
     
-    def count_common_points(self, figure1, figure2):
-        figure1_points = self.get_figure_boundary_points(figure1)
-
-        figure2_points = self.get_figure_boundary_points(figure2)
+    def set_zoom(self, zoom, anchor=None):
+        max_zoom = max(1.0, Constants.MAX_CELL_SIZE * self.grid_size / min(self.width(), self.height()))
+        zoom = min(max(zoom, 1.0), max_zoom)
         
-        common_points = figure1_points.intersection(figure2_points)
+        if anchor is None:
+            anchor = QPointF(self.width() / 2, self.height() / 2)
         
-        return len(common_points)
-
-    def get_figure_boundary_points(self, figure):
-        boundary_points = set()
+        scale = zoom / self.zoom
+        self.zoom = zoom
+        self.set_offset((self.offset_x + anchor.x()) * scale - anchor.x(), 
+                        (self.offset_y + anchor.y()) * scale - anchor.y())
+    
+    def set_offset(self, offset_x, offset_y):
+        self.offset_x = min(max(offset_x, 0.0), self.width() * (self.zoom - 1))
+        self.offset_y = min(max(offset_y, 0.0), self.height() * (self.zoom - 1))
+        self.update()
+    
+    def reset_view(self):
+        self.zoom = 1.0
+        self.set_offset(0.0, 0.0)
+    
+    def get_hover_rect(self):
+        return self.get_hover_rect_at(self.hover_cell)
+    
+    def get_hover_rect_at(self, hover_cell):
+        if hover_cell is None:
+            return QRect()
+        
+        row, col = hover_cell
+        min_row, min_col, max_row, max_col = row, col, row, col
+        for (r, c), cell_type in self.get_figure_cells(row, col):
+            min_row = min(min_row, r)
+            min_col = min(min_col, c)
+            max_row = max(max_row, r)
+            max_col = max(max_col, c)
+        
+        return self.get_cells_rect(min_row, min_col, max_row, max_col)
+    
+    def get_changed_rect(self):
+        bounds = self.board.changed_bounds
+        if bounds is None:
+            return QRect()
+        return self.get_cells_rect(*bounds)
+    
+    def set_board(self, board, rotation):
+        self.board = board
+        self.board_layer = None
+        self.board_image = None
+        self.hover_cell = None
+        self.coords_label.hide()
+        self.current_rotation = rotation
+        self.current_figure_type = 0
+        self.update_current_figure()
+        self.update_figures_count()
+        self.reset_view()
+    
+    def set_figures(self, figures):
+        self.board.load_solution(figures)
+        self.update_figures_count()
+        self.update()
+    
+    def update_figures_count(self):
+        self.figures_count_changed.emit(self.board.get_figures_count())
+    
+    def keyPressEvent(self, event):
+        pan_step_x = self.width() / 10
+        pan_step_y = self.height() / 10
         
-        for (row, col), cell_type in figure:
+        if event.key() == Qt.Key_R:
             if self.current_task in ["2a", "4.2a"]:
-                points = self.get_triangle_boundary_points(row, col, cell_type)
-                boundary_points.update(points)
+                self.change_figure_type(1)
             else:
-                points = self.get_cell_boundary_points(row, col)
-                boundary_points.update(points)
-        
-        return boundary_points
+                self.rotate_figure()
+        elif event.key() in [Qt.Key_Plus, Qt.Key_Equal]:
+            self.set_zoom(self.zoom * Constants.ZOOM_STEP)
+        elif event.key() == Qt.Key_Minus:
+            self.set_zoom(self.zoom / Constants.ZOOM_STEP)
+        elif event.key() == Qt.Key_Home:
+            self.reset_view()
+        elif event.key() == Qt.Key_Left:
+            self.set_offset(self.offset_x - pan_step_x, self.offset_y)
+        elif event.key() == Qt.Key_Right:
+            self.set_offset(self.offset_x + pan_step_x, self.offset_y)
+        elif event.key() == Qt.Key_Up:
+            self.set_offset(self.offset_x, self.offset_y - pan_step_y)
+        elif event.key() == Qt.Key_Down:
+            self.set_offset(self.offset_x, self.offset_y + pan_step_y)
+        else:
+            super().keyPressEvent(event)
 
-    def get_cell_boundary_points(self, row, col):
-        points = set()
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.ControlModifier:
+            steps = event.angleDelta().y() / 120
+            self.set_zoom(self.zoom * Constants.ZOOM_STEP ** steps, event.position())
+        elif self.current_task in ["2a", "4.2a"]:
+            delta = 1 if event.angleDelta().y() > 0 else -1
+            self.change_figure_type(delta)
+        else:
+            delta = 1 if event.angleDelta().y() > 0 else -1
+            for _ in range(abs(delta)):
+                if delta > 0:
+                    self.rotate_figure()
+                else:
+                    self.rotate_figure(-1)
         
-        vertices = [
-            (row, col, 'vertex'),
-            (row, col + 1, 'vertex'),
-            (row + 1, col, 'vertex'),
-            (row + 1, col + 1, 'vertex')
-        ]
-        points.update(vertices)
+    def resizeEvent(self, event):
+        self.set_offset(self.offset_x, self.offset_y)
+        super().resizeEvent(event)
         
-        edges = [
-            (row, col + 0.5, 'edge'),
-            (row + 1, col + 0.5, 'edge'),
-            (row + 0.5, col, 'edge'),
-            (row + 0.5, col + 1, 'edge')
-        ]
-        points.update(edges)
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
         
-        return points
+        cell_width, cell_height = self.get_cell_size()
 
-    def get_triangle_boundary_points(self, row, col, triangle_type):
-        points = set()
+        painter.drawPixmap(0, 0, self.get_board_layer())
         
-        if triangle_type == 0:
-            return self.get_cell_boundary_points(row, col)
-        
-        x1, y1 = col, row
-        x2, y2 = col + 1, row
-        x3, y3 = col, row + 1
-        x4, y4 = col + 1, row + 1
+        if self.hover_cell is not None:
+            if self.board.is_lattice_task():
+                self.draw_lattice_hover(painter, cell_width, cell_height)
+            else:
+                self.draw_hover(painter, cell_width, cell_height)
+    
+    def get_board_layer(self):
+        ratio = self.devicePixelRatioF()
+        key = (self.current_task, self.grid_size, self.width(), self.height(), ratio, 
+               self.zoom, self.offset_x, self.offset_y)
+        
+        if self.board_layer is None or self.board_layer_key != key:
+            self.board_layer = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+            self.board_layer.setDevicePixelRatio(ratio)
+            self.board_layer_key = key
+            self.board.take_changed_bounds()
+            self.render_board_layer(self.rect())
+            self.board_layer_version = self.board.version
+        
+        elif self.board_layer_version != self.board.version:
+            self.render_board_layer(self.get_changed_rect())
+            self.board.take_changed_bounds()
+            self.board_layer_version = self.board.version
+        
+        return self.board_layer
+    
+    def render_board_layer(self, rect):
+        if rect.isEmpty():
+            return
         
-        if triangle_type == 1:
-            vertices = [(x1, y1), (x2, y2), (x1, y3)]
-            edges = [
-                ((x1 + x2)/2, y1, 'edge'),
-                (x1, (y1 + y3)/2, 'edge'),
-                ((x1 + x2)/2, (y1 + y3)/2, 'edge')
-            ]
-        elif triangle_type == 2:
-            vertices = [(x1, y1), (x2, y2), (x2, y3)]
-            edges = [
-                ((x1 + x2)/2, y1, 'edge'),
-                (x2, (y1 + y3)/2, 'edge'),
-                ((x1 + x2)/2, (y1 + y3)/2, 'edge')
-            ]
-        elif triangle_type == 3:
-            vertices = [(x1, y1), (x1, y3), (x2, y3)]
-            edges = [
-                (x1, (y1 + y3)/2, 'edge'),
-                ((x1 + x2)/2, y3, 'edge'),
-                ((x1 + x2)/2, (y1 + y3)/2, 'edge')
-            ]
-        elif triangle_type == 4:
-            vertices = [(x2, y2), (x1, y3), (x2, y3)]
-            edges = [
-                (x2, (y1 + y3)/2, 'edge'),
-                ((x1 + x2)/2, y3, 'edge'),
-                ((x1 + x2)/2, (y1 + y3)/2, 'edge')
-            ]
-        else:
-            return set()
+        painter = QPainter(self.board_layer)
+        painter.setClipRect(rect)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(rect, Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.draw_board_layer(painter, rect)
+        painter.end()
+    
+    def draw_board_layer(self, painter, rect):
+        cell_width, cell_height = self.get_cell_size()
         
-        for x, y in vertices:
-            points.add((y, x, 'vertex'))
+        violating_figures = set(self.board.check_figures_touching())
         
-        for x, y, edge_type in edges:
-            points.add((y, x, edge_type))
+        if min(cell_width, cell_height) < Constants.DETAIL_CELL_SIZE:
+            if self.board.is_lattice_task():
+                self.draw_lattice_image(painter, cell_width, cell_height, violating_figures)
+            else:
+                self.draw_board_image(painter, cell_width, cell_height, violating_figures)
+            return
         
-        return points
-
-    def are_cells_touching(self, cell1, cell2):
-        figure1_points = self.get_figure_boundary_points([cell1])
-        figure2_points = self.get_figure_boundary_points([cell2])
+        if self.board.is_lattice_task():
+            self.draw_lattice_layer(painter, rect, cell_width, cell_height, violating_figures)
+            return
         
-        common_points = figure1_points.intersection(figure2_points)
-        return len(common_points) > 0
-
-    def check_figures_touching(self):
-        violating_figures = []
+        min_row, min_col, max_row, max_col = self.get_visible_bounds(rect)
+        self.draw_grid(painter, min_row, min_col, max_row, max_col, cell_width, cell_height)
         
-        if self.current_task == "2a":
-            for i in range(len(self.placed_figures)):
-                for j in range(i + 1, len(self.placed_figures)):
-                    common_points = self.count_common_points(
-                        self.placed_figures[i], 
-                        self.placed_figures[j]
-                    )
-                    if common_points > 0:
-                        violating_figures.extend([i, j])
+        grid_size = self.grid_size
+        occupancy = self.board.occupancy
+        forbidden_mask = self.board.forbidden_mask
+        is_cell_task = self.board.is_cell_task()
         
-        elif self.current_task == "4.2a":
-            for i in range(len(self.placed_figures)):
-                for j in range(i + 1, len(self.placed_figures)):
-                    common_points = self.count_common_points(
-                        self.placed_figures[i], 
-                        self.placed_figures[j]
-                    )
-                    if common_points > 1:
-                        violating_figures.extend([i, j])
+        zones, cells, figures, violating = [self.create_batch_path() for _ in range(4)]
         
-        return list(set(violating_figures))
-
-    def find_connected_components(self):
-        if not self.placed_cells:
-            return []
+        for row in range(min_row, max_row + 1):
+            start = row * grid_size + min_col
+            end = row * grid_size + max_col + 1
+            if not any(occupancy[start:end]) and not any(forbidden_mask[start:end]):
+                continue
             
-        visited = set()
-        components = []
-        
-        placed_cells_list = list(self.placed_cells)
-        
-        for cell in placed_cells_list:
-            coord, cell_type = cell
-            if coord not in visited:
-                component = []
-                stack = [cell]
+            y = row * cell_height - self.offset_y
+            
+            for col in range(min_col, max_col + 1):
+                index = row * grid_size + col
+                mask = forbidden_mask[index]
+                value = occupancy[index]
+                if not mask and not value:
+                    continue
                 
-                while stack:
-                    current_cell = stack.pop()
-                    current_coord, current_type = current_cell
-                    
-                    if current_coord not in visited:
-                        visited.add(current_coord)
-                        component.append(current_cell)
-                        
-                        for other_cell in placed_cells_list:
-                            other_coord, other_type = other_cell
-                            if other_coord not in visited:
-                                if self.are_cells_connected(current_cell, other_cell):
-                                    stack.append(other_cell)
+                x = col * cell_width - self.offset_x
+                
+                if mask:
+                    for zone_type, bit in Board.FORBIDDEN_BITS.items():
+                        if mask & bit:
+                            self.add_cell_to_path(zones, x, y, cell_width, cell_height, zone_type)
+                
+                if not value:
+                    continue
+                
+                batch = figures
+                if is_cell_task:
+                    self.add_cell_to_path(cells, x, y, cell_width, cell_height, value - 1)
+                    figure_id = self.board.find_figure_at(row, col)
+                    if figure_id is None:
+                        continue
+                    if figure_id in violating_figures:
+                        batch = violating
                 
-                components.append(component)
+                self.add_cell_to_path(batch, x, y, cell_width, cell_height, value - 1)
         
-        return components
+        self.draw_path(painter, zones, QColor(255, 0, 0, 80))
+        self.draw_path(painter, cells, QColor(0, 255, 0, 180))
+        self.draw_path(painter, figures, QColor(0, 0, 255, 180))
+        self.draw_path(painter, violating, QColor(255, 255, 0, 180))
     
-    def is_valid_component(self, component):
+    def create_batch_path(self):
+        path = QPainterPath()
+        path.setFillRule(Qt.WindingFill)
+        return path
+    
+    def add_cell_to_path(self, path, x, y, cell_width, cell_height, cell_type):
         if self.current_task in ["2a", "4.2a"]:
-            component_weight = self.get_component_weight(component)
-            return component_weight == self.variables["s"]
+            path.addPath(self.get_triangle_path(cell_type, cell_width, cell_height).translated(x, y))
         else:
-            return len(component) == self.variables["s"]
+            path.addRect(int(x), int(y), int(cell_width), int(cell_height))
     
-    def update_figures_from_components(self):
-        self.placed_figures = []
-        self.forbidden_zones = []
-        
-        components = self.find_connected_components()
+    def draw_path(self, painter, path, color):
+        if path.isEmpty():
+            return
         
-        for component in components:
-            if self.is_valid_component(component):
-                self.placed_figures.append(component)
-                forbidden_cells = self.get_forbidden_zone_cells(component)
-                self.forbidden_zones.extend(forbidden_cells)
-    
-    def get_forbidden_zone_cells(self, figure_cells):
-        if self.current_task == "2a":
-            return self.get_forbidden_zone_2a(figure_cells)
-        elif self.current_task == "4.2a":
-            return self.get_forbidden_zone_4_2a(figure_cells)
-        elif self.current_task in ["1a", "1b", "1c"]:
-            return self.get_forbidden_zone_1abc(figure_cells)
-        elif self.current_task in ["4.1a", "4.1b", "4.1c"]:
-            return self.get_forbidden_zone_4_1abc(figure_cells)
-        return []
+        if self.current_task in ["2a", "4.2a"]:
+            painter.setBrush(QBrush(color))
+            painter.setPen(QPen(Qt.black, 1))
+            painter.drawPath(path)
+        else:
+            painter.fillPath(path, QBrush(color))
     
-    def get_forbidden_zone_2a(self, figure_cells):
-        forbidden_cells = []
-        
-        for coord, cell_type in figure_cells:
-            row, col = coord
+    def draw_lattice_layer(self, painter, rect, cell_width, cell_height, violating_figures):
+        min_row, min_col, max_row, max_col = self.get_visible_bounds(rect)
+        self.draw_lattice_grid(painter, min_row, max_row, cell_width, cell_height)
+        
+        occupancy = self.board.occupancy
+        forbidden_mask = self.board.forbidden_mask
+        is_cell_task = self.board.is_cell_task()
+        center = self.get_lattice_center()
+        
+        zones, cells, figures, violating = [self.create_batch_path() for _ in range(4)]
+        
+        for row in range(min_row, max_row + 1):
+            first, last = self.get_lattice_columns(row, rect.left(), rect.right())
+            start = row * row + first
+            end = row * row + last + 1
+            if not any(occupancy[start:end]) and not any(forbidden_mask[start:end]):
+                continue
             
-            forbidden_types = [5, 6, 7, 8]
+            y = row * cell_height - self.offset_y
             
-            for forbidden_type in forbidden_types:
-                forbidden_cells.append(((row, col), forbidden_type))
+            for col in range(first, last + 1):
+                index = row * row + col
+                mask = forbidden_mask[index]
+                value = occupancy[index]
+                if not mask and not value:
+                    continue
                 
-                if cell_type == 0:
-                    for drow, dcol in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                        new_row, new_col = row + drow, col + dcol
-                        if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                            forbidden_cells.append(((new_row, new_col), forbidden_type))
-
-                    new_row, new_col = row - 1, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 6))
-                        forbidden_cells.append(((new_row, new_col), 7))
-
-                    new_row, new_col = row - 1, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 7))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row + 1, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 6))
-
-                    new_row, new_col = row + 1, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                elif cell_type == 1:
-                    for drow, dcol in [(-1, 0), (0, -1)]:
-                        new_row, new_col = row + drow, col + dcol
-                        if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                            forbidden_cells.append(((new_row, new_col), forbidden_type))
-
-                    new_row, new_col = row, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row + 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row - 1, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 6))
-                        forbidden_cells.append(((new_row, new_col), 7))
-
-                    new_row, new_col = row - 1, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 7))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row + 1, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 6))
-
-                elif cell_type == 2:
-                    for drow, dcol in [(-1, 0), (0, 1)]:
-                        new_row, new_col = row + drow, col + dcol
-                        if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                            forbidden_cells.append(((new_row, new_col), forbidden_type))
-
-                    new_row, new_col = row, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 6))
-
-                    new_row, new_col = row + 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 6))
-
-                    new_row, new_col = row - 1, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 6))
-                        forbidden_cells.append(((new_row, new_col), 7))
-
-                    new_row, new_col = row - 1, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 7))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row + 1, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                elif cell_type == 3:
-                    for drow, dcol in [(1, 0), (0, -1)]:
-                        new_row, new_col = row + drow, col + dcol
-                        if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                            forbidden_cells.append(((new_row, new_col), forbidden_type))
-
-                    new_row, new_col = row, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 7))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row - 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 7))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row - 1, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 6))
-                        forbidden_cells.append(((new_row, new_col), 7))
-
-                    new_row, new_col = row + 1, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 6))
-
-                    new_row, new_col = row + 1, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                elif cell_type == 4:
-                    for drow, dcol in [(1, 0), (0, 1)]:
-                        new_row, new_col = row + drow, col + dcol
-                        if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                            forbidden_cells.append(((new_row, new_col), forbidden_type))
-
-                    new_row, new_col = row, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 6))
-                        forbidden_cells.append(((new_row, new_col), 7))
-
-                    new_row, new_col = row - 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 6))
-                        forbidden_cells.append(((new_row, new_col), 7))
-
-                    new_row, new_col = row - 1, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 7))
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row + 1, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 6))
-
-                    new_row, new_col = row + 1, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-                        forbidden_cells.append(((new_row, new_col), 8))
-        
-        return list(set(forbidden_cells))
-    
-    def get_forbidden_zone_4_2a(self, figure_cells):
-        forbidden_cells = []
-        
-        for coord, cell_type in figure_cells:
-            row, col = coord
-            
-            forbidden_types = [5, 6, 7, 8]
-            
-            for forbidden_type in forbidden_types:
-                forbidden_cells.append(((row, col), forbidden_type))
+                x = center + (col // 2 - row / 2) * cell_width
+                path = self.get_lattice_path(col & 1, cell_width, cell_height).translated(x, y)
                 
-                if cell_type == 0:
-                    new_row, new_col = row, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 6))
+                if mask:
+                    zones.addPath(path)
                 
-                    new_row, new_col = row, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row - 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 7))
-
-                    new_row, new_col = row + 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-
-                elif cell_type == 1:
-                    new_row, new_col = row, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 6))
-
-                    new_row, new_col = row - 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 7))
-
-                elif cell_type == 2:
-                    new_row, new_col = row, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row - 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 7))
-
-                elif cell_type == 3:
-                    new_row, new_col = row, col - 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 6))
-
-                    new_row, new_col = row + 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
-
-                elif cell_type == 4:
-                    new_row, new_col = row, col + 1
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 8))
-
-                    new_row, new_col = row + 1, col
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 5))
+                if not value:
+                    continue
+                
+                batch = figures
+                figure_id = self.board.find_figure_at(row, col)
+                if is_cell_task:
+                    cells.addPath(path)
+                    if figure_id is None:
+                        continue
+                if figure_id in violating_figures:
+                    batch = violating
+                
+                batch.addPath(path)
         
-        return list(set(forbidden_cells))
+        for path, color in [(zones, QColor(255, 0, 0, 80)), (cells, QColor(0, 255, 0, 180)), 
+                            (figures, QColor(0, 0, 255, 180)), (violating, QColor(255, 255, 0, 180))]:
+            if not path.isEmpty():
+                painter.fillPath(path, QBrush(color))
     
-    def can_place_in_forbidden_zone(self, cell_coord, cell_type, forbidden_type):
-        row, col = cell_coord
+    def draw_lattice_grid(self, painter, min_row, max_row, cell_width, cell_height):
+        painter.setPen(QPen(Qt.black, 1))
         
-        if forbidden_type == 5:
-            return cell_type in [3, 4]
+        center = self.get_lattice_center()
+        last_row = min(max_row + 1, self.grid_size)
         
-        elif forbidden_type == 6:
-            return cell_type in [1, 3]
+        def point(i, j):
+            return QPointF(center + (j - i / 2) * cell_width, i * cell_height - self.offset_y)
         
-        elif forbidden_type == 7:
-            return cell_type in [1, 2]
+        for i in range(min_row, last_row + 1):
+            painter.drawLine(point(i, 0), point(i, i))
         
-        elif forbidden_type == 8:
-            return cell_type in [2, 4]
+        for j in range(last_row + 1):
+            top = max(j, min_row)
+            if top < last_row:
+                painter.drawLine(point(top, j), point(last_row, j))
         
-        return False
+        for diagonal in range(last_row + 1):
+            top = max(diagonal, min_row)
+            if top < last_row:
+                painter.drawLine(point(top, top - diagonal), point(last_row, last_row - diagonal))
     
-    def get_forbidden_zone_1abc(self, figure_cells):
-        forbidden_cells = []
-        
-        coord_cells = [coord for coord, cell_type in figure_cells]
-        
-        for row, col in coord_cells:
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-                    new_row, new_col = row + dr, col + dc
-                    if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                        forbidden_cells.append(((new_row, new_col), 0))
-        
-        forbidden_coords = set([coord for coord, cell_type in forbidden_cells])
-        figure_coords = set([coord for coord, cell_type in figure_cells])
-        forbidden_cells = [((row, col), cell_type) for (row, col), cell_type in forbidden_cells 
-                          if (row, col) not in figure_coords]
-        
-        return forbidden_cells
+    def get_lattice_path(self, parity, width, height):
+        if self.triangle_paths_size != (width, height):
+            self.triangle_paths = {}
+            self.triangle_paths_size = (width, height)
+        
+        key = ("lattice", parity)
+        path = self.triangle_paths.get(key)
+        if path is None:
+            path = QPainterPath()
+            path.addPolygon(QPolygonF([QPointF(px * width, py * height) for px, py in self.LATTICE_POINTS[parity]]))
+            path.closeSubpath()
+            self.triangle_paths[key] = path
+        return path
     
-    def get_forbidden_zone_4_1abc(self, figure_cells):
-        forbidden_cells = []
-        
-        coord_cells = [coord for coord, cell_type in figure_cells]
-        
-        for row, col in coord_cells:
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                new_row, new_col = row + dr, col + dc
-                if 0 <= new_row < self.grid_size and 0 <= new_col < self.grid_size:
-                    forbidden_cells.append(((new_row, new_col), 0))
-        
-        forbidden_coords = set([coord for coord, cell_type in forbidden_cells])
-        figure_coords = set([coord for coord, cell_type in figure_cells])
-        forbidden_cells = [((row, col), cell_type) for (row, col), cell_type in forbidden_cells 
-                          if (row, col) not in figure_coords]
-        
-        return forbidden_cells
+    def get_triangle_path(self, triangle_type, width, height):
+        if self.triangle_paths_size != (width, height):
+            self.triangle_paths = {}
+            self.triangle_paths_size = (width, height)
+        
+        path = self.triangle_paths.get(triangle_type)
+        if path is None:
+            points = self.TRIANGLE_POINTS.get(triangle_type, self.TRIANGLE_POINTS[0])
+            path = QPainterPath()
+            path.setFillRule(Qt.WindingFill)
+            path.addPolygon(QPolygonF([QPointF(px * width, py * height) for px, py in points]))
+            path.closeSubpath()
+            self.triangle_paths[triangle_type] = path
+        return path
     
-    def can_place_figure(self, row, col):
-        if self.current_task in ["1c", "4.1c", "2a", "4.2a"]:
-            coord_to_check = (row, col)
-            cell_type = self.current_figure_type if self.current_task in ["2a", "4.2a"] else 0
-
-            for placed_coord, placed_type in self.placed_cells:
-                if placed_coord == coord_to_check:
-                    return False
-
-            for forbidden_coord, forbidden_type in self.forbidden_zones:
-                if forbidden_coord == coord_to_check:
-                    if self.current_task in ["2a", "4.2a"]:
-                        if not self.can_place_in_forbidden_zone(coord_to_check, cell_type, forbidden_type):
-                            return False
-                    else:
-                        return False
-            
-            return True
+    def draw_board_image(self, painter, cell_width, cell_height, violating_figures):
+        bounds = self.get_visible_bounds(self.rect())
+        tile = max(1, int(min(cell_width, cell_height)))
+        key = (self.board.version, bounds, tile)
+        
+        if self.board_image is None or self.board_image_key != key:
+            width, height, pixels = BoardRaster.render(self.board, tile, bounds, violating_figures, 
+                                                       BoardRaster.SCREEN_COLORS)
+            image = QImage(bytes(pixels), width, height, width * 4, QImage.Format_RGBA8888)
+            self.board_image = image.copy()
+            self.board_image_key = key
+        
+        min_row, min_col, max_row, max_col = bounds
+        target = QRectF(min_col * cell_width - self.offset_x, min_row * cell_height - self.offset_y, 
+                        (max_col - min_col + 1) * cell_width, (max_row - min_row + 1) * cell_height)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, min(cell_width, cell_height) < 1)
+        painter.drawImage(target, self.board_image, QRectF(self.board_image.rect()))
+    
+    def draw_lattice_image(self, painter, cell_width, cell_height, violating_figures):
+        key = (self.board.version, "lattice")
+        
+        if self.board_image is None or self.board_image_key != key:
+            width, height, pixels = BoardRaster.render_lattice(self.board, violating_figures, 
+                                                               BoardRaster.SCREEN_COLORS)
+            image = QImage(bytes(pixels), width, height, width * 4, QImage.Format_RGBA8888)
+            self.board_image = image.copy()
+            self.board_image_key = key
+        
+        target = QRectF(self.get_lattice_center() - (self.grid_size - 0.5) * cell_width / 2, -self.offset_y, 
+                        (2 * self.grid_size - 1) * cell_width / 2, self.grid_size * cell_height)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, cell_width < 1)
+        painter.drawImage(target, self.board_image, QRectF(self.board_image.rect()))
+    
+    def draw_lattice_hover(self, painter, cell_width, cell_height):
+        row, col = self.hover_cell
+        center = self.get_lattice_center()
         
-        cells = self.get_figure_cells(row, col)
+        def get_path(r, c):
+            x = center + (c // 2 - r / 2) * cell_width
+            return self.get_lattice_path(c & 1, cell_width, cell_height).translated(x, r * cell_height - self.offset_y)
         
-        if len(cells) != len(self.current_figure):
-            return False
+        painter.save()
+        painter.setPen(QPen(Qt.red, 3))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(get_path(row, col))
+        painter.restore()
         
-        for cell_coord, cell_type in cells:
-            for figure in self.placed_figures:
-                for placed_cell_coord, placed_cell_type in figure:
-                    if placed_cell_coord == cell_coord:
-                        return False
-            
-            for forbidden_coord, forbidden_type in self.forbidden_zones:
-                if forbidden_coord == cell_coord:
-                    return False
+        if not self.can_place_figure(row, col):
+            return
         
-        return True
+        for (r, c), cell_type in self.get_figure_cells(row, col):
+            painter.fillPath(get_path(r, c), QBrush(QColor(255, 0, 0, 120)))
     
-    def place_figure(self, row, col):
-        if self.current_task in ["1c", "4.1c", "2a", "4.2a"]:
-            if self.can_place_figure(row, col):
-                cell_type = self.current_figure_type if self.current_task in ["2a", "4.2a"] else 0
-                self.placed_cells.add(((row, col), cell_type))
-                self.update_figures_from_components()
-                
-                if self.current_task in ["2a", "4.2a"]:
-                    self.check_figures_touching()
-                
-                self.update_figures_count()
-                self.update()
-                return True
-            return False
+    def draw_hover(self, painter, cell_width, cell_height):
+        row, col = self.hover_cell
+        x = col * cell_width - self.offset_x
+        y = row * cell_height - self.offset_y
         
-        if self.can_place_figure(row, col):
-            cells = self.get_figure_cells(row, col)
-            self.placed_figures.append(cells)
-            
-            forbidden_cells = self.get_forbidden_zone_cells(cells)
-            self.forbidden_zones.extend(forbidden_cells)
-            
-            if self.current_task in ["2a", "4.2a"]:
-                self.check_figures_touching()
-            
-            self.update_figures_count()
-            self.update()
-            return True
-        return False
-    
-    def remove_figure_at(self, row, col):
-        if self.current_task in ["1c", "4.1c", "2a", "4.2a"]:
-            cell_to_remove = None
-            for cell in self.placed_cells:
-                if cell[0] == (row, col):
-                    cell_to_remove = cell
-                    break
-            
-            if cell_to_remove:
-                self.placed_cells.remove(cell_to_remove)
-                self.update_figures_from_components()
-                
-                if self.current_task in ["2a", "4.2a"]:
-                    self.check_figures_touching()
-                
-                self.update_figures_count()
-                self.update()
-                return True
-            return False
+        painter.setPen(QPen(Qt.red, 3))
+        painter.drawRect(int(x), int(y), int(cell_width), int(cell_height))
+        
+        if not self.can_place_figure(row, col):
+            return
         
-        for i, figure in enumerate(self.placed_figures):
-            for cell_coord, cell_type in figure:
-                if cell_coord == (row, col):
-                    removed_figure = self.placed_figures.pop(i)
-                    
-                    self.update_all_forbidden_zones()
-                    
-                    if self.current_task in ["2a", "4.2a"]:
-                        self.check_figures_touching()
-                    
-                    self.update_figures_count()
-                    self.update()
-                    return True
-        return False
-    
-    def update_all_forbidden_zones(self):
-        self.forbidden_zones = []
-        for figure in self.placed_figures:
-            forbidden_cells = self.get_forbidden_zone_cells(figure)
-            self.forbidden_zones.extend(forbidden_cells)
-    
-    def update_figures_count(self):
-        count = len(self.placed_figures)
-        self.figures_count_changed.emit(count)
-    
-    def keyPressEvent(self, event):
-        if event.key() == Qt.Key_R:
-            if self.current_task in ["2a", "4.2a"]:
-                self.change_figure_type(1)
-            else:
-                self.rotate_figure()
-        else:
-            super().keyPressEvent(event)
-
-    def wheelEvent(self, event):
         if self.current_task in ["2a", "4.2a"]:
-            delta = 1 if event.angleDelta().y() > 0 else -1
-            self.change_figure_type(delta)
+            self.draw_triangle(painter, x, y, cell_width, cell_height, 
+                             self.current_figure_type, QColor(255, 0, 0, 120))
+        elif self.current_task in ["1c", "4.1c"]:
+            painter.fillRect(int(x), int(y), int(cell_width), int(cell_height), 
+                           QBrush(QColor(255, 0, 0, 120)))
         else:
-            delta = 1 if event.angleDelta().y() > 0 else -1
-            for _ in range(abs(delta)):
-                if delta > 0:
-                    self.rotate_figure()
-                else:
-                    self.current_rotation = (self.current_rotation - 1) % 4
-                    self.update_current_figure()
-                    self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        width = self.width()
-        height = self.height()
-        
-        cell_width = width / self.grid_size
-        cell_height = height / self.grid_size
-
-        if self.current_task in ["1a", "4.1a", "1b", "4.1b", "1c", "4.1c", "2a", "4.2a"]:
-            self.draw_grid(painter, width, height, cell_width, cell_height)
-            
-            violating_figures_indices = []
-            if self.current_task in ["2a", "4.2a"]:
-                violating_figures_indices = self.check_figures_touching()
-
-            for zone_coord, zone_type in self.forbidden_zones:
-                row, col = zone_coord
-                x = col * cell_width
-                y = row * cell_height
-                
-                if self.current_task in ["2a", "4.2a"]:
-                    self.draw_triangle(painter, x, y, cell_width, cell_height, zone_type, 
-                                     QColor(255, 0, 0, 80))
-                else:
-                    painter.fillRect(int(x), int(y), int(cell_width), int(cell_height), 
-                                   QBrush(QColor(255, 0, 0, 80)))
-            
-            for coord, cell_type in self.placed_cells:
-                row, col = coord
-                x = col * cell_width
-                y = row * cell_height
-                
-                if self.current_task in ["2a", "4.2a"]:
-                    self.draw_triangle(painter, x, y, cell_width, cell_height, cell_type, 
-                                     QColor(0, 255, 0, 180))
-                else:
-                    color = QColor(0, 255, 0, 180)
-                    painter.fillRect(int(x), int(y), int(cell_width), int(cell_height), 
-                                   QBrush(color))
-            
-            for i, figure in enumerate(self.placed_figures):
-                figure_color = QColor(0, 0, 255, 180)
-
-                if i in violating_figures_indices:
-                    figure_color = QColor(255, 255, 0, 180)
-                
-                for coord, cell_type in figure:
-                    row, col = coord
-                    x = col * cell_width
-                    y = row * cell_height
-                    
-                    if self.current_task in ["2a", "4.2a"]:
-                        self.draw_triangle(painter, x, y, cell_width, cell_height, cell_type, 
-                                        figure_color)
-                    else:
-                        painter.fillRect(int(x), int(y), int(cell_width), int(cell_height), 
-                                    QBrush(figure_color))
-        
-        if (self.hover_cell is not None and 
-            self.current_task in ["1a", "4.1a", "1b", "4.1b", "1c", "4.1c", "2a", "4.2a"] and
-            self.can_place_figure(*self.hover_cell)):
-            
-            row, col = self.hover_cell
-            x = col * cell_width
-            y = row * cell_height
-            
-            painter.setPen(QPen(Qt.red, 3))
-            painter.drawRect(int(x), int(y), int(cell_width), int(cell_height))
-            
-            if self.current_task in ["2a", "4.2a"]:
-                self.draw_triangle(painter, x, y, cell_width, cell_height, 
-                                 self.current_figure_type, QColor(255, 0, 0, 120))
-            elif self.current_task in ["1c", "4.1c"]:
-                painter.fillRect(int(x), int(y), int(cell_width), int(cell_height), 
+            cells = self.get_figure_cells(row, col)
+            for coord, cell_type in cells:
+                r, c = coord
+                x_cell = c * cell_width - self.offset_x
+                y_cell = r * cell_height - self.offset_y
+                painter.fillRect(int(x_cell), int(y_cell), int(cell_width), int(cell_height), 
                                QBrush(QColor(255, 0, 0, 120)))
-            else:
-                cells = self.get_figure_cells(row, col)
-                for coord, cell_type in cells:
-                    r, c = coord
-                    x_cell = c * cell_width
-                    y_cell = r * cell_height
-                    painter.fillRect(int(x_cell), int(y_cell), int(cell_width), int(cell_height), 
-                                   QBrush(QColor(255, 0, 0, 120)))
-        
-        elif self.hover_cell is not None and self.current_task in ["1a", "4.1a", "1b", "4.1b", "1c", "4.1c", "2a", "4.2a"]:
-            row, col = self.hover_cell
-            x = col * cell_width
-            y = row * cell_height
-            
-            painter.setPen(QPen(Qt.red, 3))
-            painter.drawRect(int(x), int(y), int(cell_width), int(cell_height))
-            
-        elif self.current_task in ["3a", "3b", "4.3a", "4.3b"]:
-            painter.fillRect(0, 0, width, height, QBrush(QColor(240, 240, 240)))
-            painter.setPen(QPen(Qt.black, 2))
-            painter.drawText(self.rect(), Qt.AlignCenter, f"Пункты {self.current_task}\n(реализация в разработке)")
     
     def draw_triangle(self, painter, x, y, width, height, triangle_type, color):
         painter.save()
-        
         painter.setBrush(QBrush(color))
         painter.setPen(QPen(Qt.black, 1))
-        
-        points = []
-        
-        if triangle_type == 0:
-            points = [
-                QPointF(x, y),
-                QPointF(x + width, y),
-                QPointF(x + width, y + height),
-                QPointF(x, y + height)
-            ]
-        elif triangle_type == 1:
-            points = [
-                QPointF(x, y),
-                QPointF(x + width, y),
-                QPointF(x, y + height)
-            ]
-        elif triangle_type == 2:
-            points = [
-                QPointF(x, y),
-                QPointF(x + width, y),
-                QPointF(x + width, y + height)
-            ]
-        elif triangle_type == 3:
-            points = [
-                QPointF(x, y),
-                QPointF(x, y + height),
-                QPointF(x + width, y + height)
-            ]
-        elif triangle_type == 4:
-            points = [
-                QPointF(x + width, y),
-                QPointF(x, y + height),
-                QPointF(x + width, y + height)
-            ]
-        elif triangle_type == 5:
-            points = [
-                QPointF(x, y),
-                QPointF(x + width, y),
-                QPointF(x + width/2, y + height/2)
-            ]
-        elif triangle_type == 6:
-            points = [
-                QPointF(x + width, y),
-                QPointF(x + width, y + height),
-                QPointF(x + width/2, y + height/2)
-            ]
-        elif triangle_type == 7:
-            points = [
-                QPointF(x, y + height),
-                QPointF(x + width, y + height),
-                QPointF(x + width/2, y + height/2)
-            ]
-        elif triangle_type == 8:
-            points = [
-                QPointF(x, y),
-                QPointF(x, y + height),
-                QPointF(x + width/2, y + height/2)
-            ]
-        else:
-            points = [
-                QPointF(x, y),
-                QPointF(x + width, y),
-                QPointF(x + width, y + height),
-                QPointF(x, y + height)
-            ]
-        
-        if points:
-            polygon = QPolygonF(points)
-            painter.drawPolygon(polygon)
-        
+        painter.drawPath(self.get_triangle_path(triangle_type, width, height).translated(x, y))
         painter.restore()
     
-    def draw_grid(self, painter, width, height, cell_width, cell_height):
+    def draw_grid(self, painter, min_row, min_col, max_row, max_col, cell_width, cell_height):
         painter.setPen(QPen(Qt.black, 1))
         
-        for i in range(self.grid_size + 1):
-            x = i * cell_width
-            painter.drawLine(int(x), 0, int(x), height)
+        top = int(min_row * cell_height - self.offset_y)
+        bottom = int((max_row + 1) * cell_height - self.offset_y)
+        left = int(min_col * cell_width - self.offset_x)
+        right = int((max_col + 1) * cell_width - self.offset_x)
         
-        for i in range(self.grid_size + 1):
-            y = i * cell_height
-            painter.drawLine(0, int(y), width, int(y))
+        for i in range(min_col, max_col + 2):
+            x = i * cell_width - self.offset_x
+            painter.drawLine(int(x), top, int(x), bottom)
+        
+        for i in range(min_row, max_row + 2):
+            y = i * cell_height - self.offset_y
+            painter.drawLine(left, int(y), right, int(y))
     
     def mouseMoveEvent(self, event: QMouseEvent):
-        if self.current_task not in ["1a", "4.1a", "1b", "4.1b", "1c", "4.1c", "2a", "4.2a"]:
-            self.hover_cell = None
-            self.coords_label.hide()
-            return
-            
         if self.grid_size == 0:
             return
+        
+        if self.pan_start is not None:
+            position, offset_x, offset_y = self.pan_start
+            delta = event.position() - position
+            self.set_offset(offset_x - delta.x(), offset_y - delta.y())
             
         width = self.width()
         height = self.height()
         
-        cell_width = width / self.grid_size
-        cell_height = height / self.grid_size
+        row, col = self.get_cell_at(event.position().x(), event.position().y())
         
-        col = int(event.position().x() / cell_width)
-        row = int(event.position().y() / cell_height)
+        old_hover_cell = self.hover_cell
         
-        if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
+        if self.board.in_bounds(row, col):
             self.hover_cell = (row, col)
             
             self.coords_label.setText(f"({row}, {col})")
@@ -1037,35 +693,29 @@ class GridWidget(QWidget):
             self.hover_cell = None
             self.coords_label.hide()
 
-        self.update()
+        if self.hover_cell != old_hover_cell:
+            old_rect = self.get_hover_rect_at(old_hover_cell)
+            self.update(old_rect.united(self.get_hover_rect()))
     
     def mousePressEvent(self, event: QMouseEvent):
-        if self.current_task in ["1a", "4.1a", "1b", "4.1b", "1c", "4.1c", "2a", "4.2a"]:
-            if event.button() == Qt.LeftButton and self.hover_cell is not None:
-                row, col = self.hover_cell
-                
-                figure_exists = False
-                for figure in self.placed_figures:
-                    for coord, cell_type in figure:
-                        if coord == (row, col):
-                            figure_exists = True
-                            break
-                    if figure_exists:
-                        break
-                
-                if self.current_task in ["1c", "4.1c", "2a", "4.2a"]:
-                    cell_exists = any(coord == (row, col) for coord, cell_type in self.placed_cells)
-                    if cell_exists:
-                        self.remove_figure_at(row, col)
-                    else:
-                        self.place_figure(row, col)
-                else:
-                    if figure_exists:
-                        self.remove_figure_at(row, col)
-                    else:
-                        self.place_figure(row, col)
+        if event.button() in [Qt.RightButton, Qt.MiddleButton]:
+            self.pan_start = (event.position(), self.offset_x, self.offset_y)
+            return
+        
+        if event.button() == Qt.LeftButton and self.hover_cell is not None:
+            row, col = self.hover_cell
+            
+            if self.board.is_occupied(row, col):
+                self.remove_figure_at(row, col)
+            else:
+                self.place_figure(row, col)
+    
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        if event.button() in [Qt.RightButton, Qt.MiddleButton]:
+            self.pan_start = None
     
     def leaveEvent(self, event):
+        old_rect = self.get_hover_rect()
         self.hover_cell = None
         self.coords_label.hide()
-        self.update()
\ No newline at end of file
+        self.update(old_rect)
\ No newline at end of file
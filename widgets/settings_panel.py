@@ -65,6 +65,14 @@ class SettingsPanel(QWidget):
         self.t_layout.addStretch()
         layout.addWidget(self.t_widget)
         
+        layout.addSpacing(10)
+        
+        layout.addWidget(QLabel("Время эвристического поиска (с):"))
+        self.time_budget_input = QSpinBox()
+        self.time_budget_input.setRange(1, Constants.MAX_HEURISTIC_TIME_LIMIT)
+        self.time_budget_input.setValue(Constants.HEURISTIC_TIME_LIMIT)
+        layout.addWidget(self.time_budget_input)
+        
         self.s_widget.setVisible(False)
         self.t_widget.setVisible(False)
         
@@ -115,6 +123,9 @@ class SettingsPanel(QWidget):
     def get_grid_size(self):
         return self.grid_size_input.value()
     
+    def get_time_budget(self):
+        return self.time_budget_input.value()
+    
     def get_selected_task(self):
         return self.task_combo.currentText()
     
@@ -133,7 +144,7 @@ class SettingsPanel(QWidget):
         elif task in ["1c", "4.1c"]:
             self.s_widget.setVisible(True)
             self.t_widget.setVisible(False)
-        elif task in ["2a", "4.2a"]:
+        elif task in ["2a", "4.2a", "3a", "3b", "4.3a", "4.3b"]:
             self.s_widget.setVisible(True)
             self.t_widget.setVisible(False)
         else:
@@ -147,7 +158,7 @@ class SettingsPanel(QWidget):
             parameters_text = f"Пункт: {self.current_task}\nn: {self.current_grid_size}\ns: {self.current_variables['s']}\nt: {self.current_variables['t']}\n(Используйте R или колесико мыши)"
         elif self.current_task in ["1c", "4.1c"]:
             parameters_text = f"Пункт: {self.current_task}\nn: {self.current_grid_size}\ns: {self.current_variables['s']}\n(Используйте R или колесико мыши)"
-        elif self.current_task in ["2a", "4.2a"]:
+        elif self.current_task in ["2a", "4.2a", "3a", "3b", "4.3a", "4.3b"]:
             parameters_text = f"Пункт: {self.current_task}\nn: {self.current_grid_size}\ns: {self.current_variables['s']}\n(Используйте R или колесико мыши)"
         else:
             parameters_text = f"Пункт: {self.current_task}\nn: {self.current_grid_size}\n(Используйте R или колесико мыши)"
@@ -170,7 +181,7 @@ class SettingsPanel(QWidget):
         elif self.current_task in ["1c", "4.1c"]:
             self.current_variables["s"] = self.s_input.value()
             self.current_variables["t"] = 1
-        elif self.current_task in ["2a", "4.2a"]:
+        elif self.current_task in ["2a", "4.2a", "3a", "3b", "4.3a", "4.3b"]:
             self.current_variables["s"] = self.s_input.value()
             self.current_variables["t"] = 1
         else: